@@ -19,6 +19,13 @@ Examples:
     # Round-robin: test one model per run, cycling through all
     python run_monitor.py --cycle
 
+    # Run up to 4 notebooks concurrently (durations then include queueing,
+    # which can push results into SLOW)
+    python run_monitor.py --parallel 4
+
+    # Execute notebooks in 4 worker processes
+    python run_monitor.py --jobs 4
+
     # Show all tracked model statuses
     python run_monitor.py --show-status
 
@@ -30,13 +37,21 @@ Cloud Deployment:
     See README.md for detailed setup instructions.
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
 import os
 import sys
 import re
 from pathlib import Path
 
 
+# Matches KEY="value", KEY='value' or KEY=value lines in .env.local.
+# Anchored per line, so comments and blank lines never match.
+_ENV_RE = re.compile(r'^[ \t]*([A-Z_]+)=["\']?([^"\'\r\n]+?)["\']?[ \t]*\r?$', re.MULTILINE)
+
+
 def load_env_local():
     """Load environment variables from .env.local file."""
     env_file = Path(__file__).parent / ".env.local"
@@ -44,16 +59,12 @@ def load_env_local():
         return
 
     print(f"Loading credentials from {env_file.name}")
-    with open(env_file) as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-            # Parse KEY="value" or KEY=value
-            match = re.match(r'^([A-Z_]+)=["\']?([^"\']+)["\']?$', line)
-            if match and not os.environ.get(match.group(1)):
-                os.environ[match.group(1)] = match.group(2)
+    pairs = {}
+    for m in _ENV_RE.finditer(env_file.read_text()):
+        pairs.setdefault(*m.groups())  # First definition of a key wins
+
+    # Existing (non-empty) environment variables take precedence
+    os.environ.update({k: v for k, v in pairs.items() if not os.environ.get(k)})
 
 
 # Load .env.local before anything else
@@ -62,13 +73,22 @@ load_env_local()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Runner, dashboard and notebook generation are imported where they are
+# used, so --status-only and friends don't pay for loading them.
 from src.models import get_available_models, print_status_summary, fetch_ndif_status, BASELINE_MODELS
-from src.runner import run_monitor, MonitorRunner
-from src.dashboard import generate_dashboard
-from src.notebook_generator import generate_all_colab_notebooks
+from src.results import list_model_status_paths
 
+import gzip
+import hashlib
+import json
 import shutil
-import subprocess
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: stdlib json is used instead
 
 
 def generate_and_commit_colab_notebooks(
@@ -83,6 +103,8 @@ def generate_and_commit_colab_notebooks(
         models: List of model names to generate notebooks for
         github_repo: GitHub repo name for notebook metadata
     """
+    from src.notebook_generator import generate_all_colab_notebooks
+
     colab_dir = notebooks_dir / "colab"
 
     print(f"\nGenerating Colab notebooks for {len(models)} models...")
@@ -96,15 +118,178 @@ def generate_and_commit_colab_notebooks(
     total = sum(len(paths) for paths in results.values())
     print(f"\nGenerated {total} Colab notebooks in {colab_dir}/")
 
+    _write_colab_manifest(colab_dir)
+
+
+def _write_colab_manifest(colab_dir: Path) -> None:
+    """Record {model: [notebook paths relative to colab_dir]} in index.json.
+
+    The manifest is rebuilt from the notebooks on disk, so it lists exactly
+    the notebooks in the tree (including models generated in earlier runs)
+    and clients can read it in one request.
+    """
+    manifest_path = colab_dir / "index.json"
+    manifest = {}
+    for model_dir in sorted(p for p in colab_dir.iterdir() if p.is_dir()):
+        notebooks = sorted(model_dir.glob("*.ipynb"))
+        if notebooks:
+            # Directories are named by generate_colab_notebooks_for_model
+            manifest[model_dir.name.replace("--", "/")] = [
+                p.relative_to(colab_dir).as_posix() for p in notebooks
+            ]
+
+    if orjson is not None:
+        payload = orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    else:
+        payload = (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode()
+    if not manifest_path.exists() or manifest_path.read_bytes() != payload:
+        manifest_path.write_bytes(payload)
+
+
+# Deploy copies are I/O bound (often NFS round-trips), so overlap them
+DEPLOY_COPY_WORKERS = 16
+
+
+# Regenerated every run, usually with identical content (the .gz companions
+# are written with mtime=0, so identical content compresses identically)
+_CONTENT_HASHED_SUFFIXES = {".json", ".html", ".gz"}
+
+
+def _file_digest(path: Path) -> str:
+    """Hash file contents (used for small, frequently rewritten JSON files)."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _is_up_to_date(src: Path, dst: Path) -> bool:
+    """Check whether dst already matches src.
+
+    Size + mtime is enough for most files. The dashboard HTML and status
+    JSON files (and their .gz companions) are rewritten on every run even
+    when nothing changed, so for those compare content hashes.
+    """
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src.stat()
+    if dst_stat.st_size != src_stat.st_size:
+        return False
+    if int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+        return True
+    return src.suffix in _CONTENT_HASHED_SUFFIXES and _file_digest(src) == _file_digest(dst)
+
+
+def _make_world_readable(path: Path) -> None:
+    """Equivalent of chmod a+rX: readable by all, directories also traversable."""
+    mode = os.stat(path).st_mode
+    extra = 0o555 if stat.S_ISDIR(mode) else 0o444
+    if mode & extra != extra:
+        os.chmod(path, mode | extra)
+
+
+def _copy_file(pair: tuple) -> bool:
+    """Copy a (src, dst) pair unless dst is up to date. Returns True if copied.
+
+    Copied files are made world-readable for web serving as part of the copy.
+    """
+    src, dst = pair
+    if _is_up_to_date(src, dst):
+        return False
+    shutil.copy2(src, dst)
+    _make_world_readable(dst)
+    return True
+
+
+def _copy_files(pairs: list) -> list:
+    """Copy (src, dst) pairs concurrently. Returns the dst paths actually copied."""
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=DEPLOY_COPY_WORKERS) as executor:
+        copied = list(executor.map(_copy_file, pairs))
+    return [dst for (_, dst), was_copied in zip(pairs, copied) if was_copied]
+
+
+def _write_models_bundle(model_files: list, data_dir: Path) -> list:
+    """Combine per-model status files into data/models_all.json (+ .json.gz).
+
+    Lets clients fetch every model's status in one request. Files are only
+    rewritten when the combined content changes.
+
+    Returns:
+        List of paths that were (re)written
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    bundle = {}
+    for src in sorted(model_files):
+        try:
+            bundle[src.stem] = loads(src.read_bytes())
+        except (OSError, ValueError):
+            continue
+    if orjson is not None:
+        payload = orjson.dumps(bundle, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(bundle, separators=(",", ":"), sort_keys=True).encode()
+
+    dst = data_dir / "models_all.json"
+    if dst.exists() and dst.read_bytes() == payload:
+        return []
+
+    written = []
+    # mtime=0 keeps the gzip output reproducible for identical payloads
+    for path, data in ((dst, payload), (dst.with_suffix(".json.gz"), gzip.compress(payload, mtime=0))):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        written.append(path)
+    return written
+
+
+def _sync_colab_tree(colab_src: Path, colab_dst: Path) -> tuple:
+    """Mirror the Colab notebook tree into the deploy directory.
+
+    Returns:
+        (copied dst paths, total file count, notebook count)
+    """
+    colab_pairs = []
+    for dirpath, _, filenames in os.walk(colab_src):
+        rel_dir = Path(dirpath).relative_to(colab_src)
+        (colab_dst / rel_dir).mkdir(parents=True, exist_ok=True)
+        for name in filenames:
+            colab_pairs.append((Path(dirpath) / name, colab_dst / rel_dir / name))
+
+    # Remove deployed files that no longer exist in the source tree
+    expected = {dst for _, dst in colab_pairs}
+    for dirpath, _, filenames in os.walk(colab_dst):
+        for name in filenames:
+            path = Path(dirpath) / name
+            if path not in expected:
+                path.unlink()
+
+    nb_count = sum(1 for src, _ in colab_pairs if src.suffix == ".ipynb")
+    return _copy_files(colab_pairs), len(colab_pairs), nb_count
+
+
+async def _run_deploy_phases(*phases):
+    """Run independent blocking deploy phases concurrently in worker threads."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(None, phase) for phase in phases))
+
 
 def deploy_dashboard(results_dir: Path, deploy_path: str, notebooks_dir: Path = None) -> None:
     """Deploy dashboard files to target directory.
 
     Copies:
-    - index.html (dashboard)
-    - data/status.json (dashboard data)
+    - index.html[.gz] (dashboard)
+    - data/status.json[.gz] (dashboard data)
+    - data/dashboard.<hash>.css[.gz] (dashboard styles)
+    - data/dashboard.<hash>.js[.gz] (dashboard script; older hashes are removed)
     - data/models/*.json (per-model status files)
+    - data/models_all.json[.gz] (all model status files combined)
     - notebooks/colab/* (Colab notebooks for reproducibility)
+
+    Files whose size and mtime already match the deployed copy are skipped.
+    The dashboard files, the combined model payload and the Colab tree are
+    independent, so those three phases run concurrently.
     """
     deploy_dir = Path(deploy_path)
 
@@ -113,49 +298,89 @@ def deploy_dashboard(results_dir: Path, deploy_path: str, notebooks_dir: Path =
     (deploy_dir / "data").mkdir(exist_ok=True)
     (deploy_dir / "data" / "models").mkdir(exist_ok=True)
 
-    # Copy dashboard HTML as index.html
-    dashboard_src = results_dir / "dashboard.html"
-    if dashboard_src.exists():
-        shutil.copy2(dashboard_src, deploy_dir / "index.html")
-        print(f"  Deployed: index.html")
-
-    # Copy data/status.json
-    data_src = results_dir / "data" / "status.json"
-    if data_src.exists():
-        shutil.copy2(data_src, deploy_dir / "data" / "status.json")
-        print(f"  Deployed: data/status.json")
+    # Collect dashboard (src, dst) pairs
+    pairs = []
+
+    # Copy dashboard HTML as index.html, and data/status.json, each with
+    # its precompressed .gz companion
+    for src, dst in (
+        (results_dir / "dashboard.html", deploy_dir / "index.html"),
+        (results_dir / "data" / "status.json", deploy_dir / "data" / "status.json"),
+    ):
+        for suffix in ("", ".gz"):
+            src_file = src.with_name(src.name + suffix)
+            if src_file.exists():
+                pairs.append((src_file, dst.with_name(dst.name + suffix)))
+
+    # Copy the content-hashed dashboard stylesheet(s) and script(s)
+    asset_patterns = ("dashboard.*.css*", "dashboard.*.js*")
+    asset_names = set()
+    for pattern in asset_patterns:
+        for asset_src in (results_dir / "data").glob(pattern):
+            asset_names.add(asset_src.name)
+            pairs.append((asset_src, deploy_dir / "data" / asset_src.name))
 
     # Copy model status JSON files to data/models/
-    model_files = list(results_dir.glob("*.json"))
-    model_count = 0
+    model_files = [Path(p) for p in list_model_status_paths(results_dir)]
     for src in model_files:
-        if src.name.startswith(".") or src.name.startswith("run_"):
-            continue
-        dst = deploy_dir / "data" / "models" / src.name
-        shutil.copy2(src, dst)
-        model_count += 1
+        pairs.append((src, deploy_dir / "data" / "models" / src.name))
+
+    def write_bundle() -> list:
+        # Single combined payload so clients need one request instead of N
+        if not model_files:
+            return []
+        written = _write_models_bundle(model_files, deploy_dir / "data")
+        for path in written:
+            _make_world_readable(path)
+        return written
+
+    def sync_colab() -> tuple:
+        colab_src = notebooks_dir / "colab" if notebooks_dir else None
+        if colab_src is None or not colab_src.exists():
+            return [], 0, None
+        return _sync_colab_tree(colab_src, deploy_dir / "notebooks")
+
+    copied, bundle_files, (colab_copied, colab_total, nb_count) = asyncio.run(
+        _run_deploy_phases(lambda: _copy_files(pairs), write_bundle, sync_colab)
+    )
 
-    if model_count > 0:
+    # Remove assets of earlier builds, now that index.html points at the
+    # current ones (pruning before the copy would break pages mid-deploy)
+    if asset_names:
+        for pattern in asset_patterns:
+            for old in (deploy_dir / "data").glob(pattern):
+                if old.name not in asset_names:
+                    old.unlink()
+
+    # Only report what actually changed
+    copied_set = set(copied)
+    for dst in (deploy_dir / "index.html", deploy_dir / "data" / "status.json"):
+        if dst in copied_set:
+            print(f"  Deployed: {dst.relative_to(deploy_dir)}")
+    for dst in copied:
+        if dst.suffix in (".css", ".js"):
+            print(f"  Deployed: {dst.relative_to(deploy_dir)}")
+    model_count = sum(1 for dst in copied if dst.parent == deploy_dir / "data" / "models")
+    if model_count:
         print(f"  Deployed: {model_count} model status files to data/models/")
-
-    # Copy Colab notebooks if available
-    if notebooks_dir:
-        colab_src = notebooks_dir / "colab"
-        if colab_src.exists():
-            colab_dst = deploy_dir / "notebooks"
-            if colab_dst.exists():
-                shutil.rmtree(colab_dst)
-            shutil.copytree(colab_src, colab_dst)
-            # Count notebooks
-            nb_count = len(list(colab_dst.rglob("*.ipynb")))
-            print(f"  Deployed: {nb_count} Colab notebooks to notebooks/")
-
-    # Set permissions for web serving (chmod a+rX)
-    try:
-        subprocess.run(["chmod", "-R", "a+rX", str(deploy_dir)], check=True)
-        print(f"  Set permissions: chmod -R a+rX {deploy_dir}")
-    except subprocess.CalledProcessError:
-        print(f"  Warning: Could not set permissions on {deploy_dir}")
+    if bundle_files:
+        print("  Deployed: data/models_all.json")
+    nb_copied = sum(1 for dst in colab_copied if dst.suffix == ".ipynb")
+    if nb_copied:
+        print(f"  Deployed: {nb_copied} of {nb_count} Colab notebooks to notebooks/")
+
+    copied = copied + colab_copied
+    total = len(pairs) + colab_total
+    print(f"  Copied {len(copied)} of {total} files ({total - len(copied)} unchanged)")
+
+    # Directories holding changed files must be traversable for web serving
+    if copied:
+        deploy_dirs = {deploy_dir}
+        for dst in copied:
+            deploy_dirs.update(d for d in dst.parents if deploy_dir in d.parents)
+        for path in deploy_dirs:
+            _make_world_readable(path)
+        print(f"  Set permissions: a+rX on {len(copied)} files")
 
     print(f"\nDashboard deployed to: {deploy_dir}")
 
@@ -226,6 +451,28 @@ Examples:
         help="Round-robin mode: test one model per run, cycling through all",
     )
 
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N notebooks concurrently (default: 1 = sequential)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Execute notebooks in N worker processes (default: 1 = use --parallel threads)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh NDIF status (skip the short-lived status cache)",
+    )
+
     parser.add_argument(
         "--no-save",
         action="store_true",
@@ -235,7 +482,7 @@ Examples:
     parser.add_argument(
         "--output",
         type=str,
-        help="Custom output filename for run log",
+        help="Custom run log filename (default: run_log.jsonl; a .json name writes a standalone file)",
     )
 
     parser.add_argument(
@@ -279,6 +526,8 @@ Examples:
 
     # Show tracked statuses
     if args.show_status:
+        from src.runner import MonitorRunner
+
         runner = MonitorRunner(
             notebooks_dir=args.notebooks_dir,
             results_dir=str(results_dir),
@@ -303,6 +552,8 @@ Examples:
 
     # Dashboard only mode
     if args.dashboard_only:
+        from src.dashboard import generate_dashboard
+
         print("Generating dashboard from existing history...")
         dashboard_path = generate_dashboard(
             results_dir=str(results_dir),
@@ -328,8 +579,9 @@ Examples:
     print("NDIF Monitor")
     print("=" * 60)
 
+    status_cache_dir = None if args.no_cache else results_dir / ".cache"
     try:
-        status = fetch_ndif_status()
+        status = fetch_ndif_status(cache_dir=status_cache_dir)
         models = get_available_models(status, hot_only=True)
         print_status_summary(models)
     except Exception as e:
@@ -346,7 +598,7 @@ Examples:
     if not notebooks_dir.exists():
         notebooks_dir.mkdir(parents=True, exist_ok=True)
 
-    from src.runner import DEFAULT_SCENARIOS
+    from src.runner import DEFAULT_SCENARIOS, MonitorRunner
     print(f"\nTest scenarios: {len(DEFAULT_SCENARIOS)}")
     for s in DEFAULT_SCENARIOS:
         print(f"  - {s.name}: {s.description}")
@@ -365,12 +617,15 @@ Examples:
     runner = MonitorRunner(
         notebooks_dir=str(notebooks_dir),
         results_dir=str(results_dir),
+        use_status_cache=not args.no_cache,
     )
 
     result = runner.run(
         max_per_architecture=args.max_models,
         env_vars=env_vars if env_vars else None,
         cycle=args.cycle,
+        parallel=max(1, args.parallel),
+        jobs=max(1, args.jobs),
     )
 
     # Save run log (per-model files are always saved during run)
@@ -379,6 +634,8 @@ Examples:
 
     # Generate dashboard if requested or deploying
     if args.dashboard or args.deploy:
+        from src.dashboard import generate_dashboard
+
         print("\n" + "=" * 60)
         print("Generating dashboard...")
         dashboard_path = generate_dashboard(
@@ -6,13 +6,28 @@ Generates a static HTML page with:
 - Colab links for reproducing failures
 """
 
+import gzip
+import hashlib
 import json
-from datetime import datetime, timedelta
+import operator
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from string import Template
+from typing import Dict, List, Any, Optional, Tuple
 
-from .history import HistoryStore, get_hostname, get_username
-from .results import ModelStatus, model_to_filename
+from .history import EASTERN, HistoryStore, HistoryEntry, get_hostname, get_username, utc_to_eastern_date
+from .results import STATUS_LOAD_WORKERS, ModelStatus, model_to_filename, scan_model_status_files
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: stdlib json is used instead
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # GitHub repo info for Colab links
@@ -31,6 +46,105 @@ def generate_colab_url(notebook: str, model: str) -> str:
     return base_url
 
 
+# Static reproducer notebook cells, built once at import and shared by every
+# notebook generate_reproducer_notebook returns. Model-specific cells are
+# assembled per call.
+_INSTALL_CELL = {
+    "cell_type": "code",
+    "metadata": {},
+    "source": (
+        "# Install dependencies\n"
+        "!pip install -q nnsight torch\n"
+    ),
+    "execution_count": None,
+    "outputs": []
+}
+
+_SETUP_CELL = {
+    "cell_type": "code",
+    "metadata": {},
+    "source": (
+        "# Set up nnsight\n"
+        "import nnsight\n"
+        "from nnsight import LanguageModel\n"
+        "\n"
+        "# Configure API key (get from nnsight.net)\n"
+        "# nnsight.CONFIG.API.APIKEY = 'your-api-key'\n"
+        "\n"
+        'model = LanguageModel(MODEL_NAME, device_map="auto")\n'
+    ),
+    "execution_count": None,
+    "outputs": []
+}
+
+_SCENARIO_CELLS = {
+    "basic_trace": {
+        "cell_type": "code",
+        "metadata": {},
+        "source": (
+            "# Basic trace test\n"
+            'prompt = "The quick brown fox"\n'
+            "\n"
+            "with model.trace(prompt, remote=True):\n"
+            "    # Try to access hidden states\n"
+            "    if hasattr(model, 'transformer'):\n"
+            "        hidden = model.transformer.h[0].output[0].save()\n"
+            "    elif hasattr(model, 'model') and hasattr(model.model, 'layers'):\n"
+            "        hidden = model.model.layers[0].output[0].save()\n"
+            "    elif hasattr(model, 'gpt_neox'):\n"
+            "        hidden = model.gpt_neox.layers[0].output[0].save()\n"
+            "\n"
+            "print(f'Hidden state shape: {hidden.shape}')\n"
+            "print('SUCCESS: Basic trace works!')\n"
+        ),
+        "execution_count": None,
+        "outputs": []
+    },
+    "generation": {
+        "cell_type": "code",
+        "metadata": {},
+        "source": (
+            "# Generation test\n"
+            'prompt = "Once upon a time"\n'
+            "\n"
+            "with model.generate(prompt, max_new_tokens=20, remote=True):\n"
+            "    output = model.generator.output.save()\n"
+            "\n"
+            "generated = model.tokenizer.decode(output[0])\n"
+            "print(f'Generated: {generated}')\n"
+            "print('SUCCESS: Generation works!')\n"
+        ),
+        "execution_count": None,
+        "outputs": []
+    },
+    "hidden_states": {
+        "cell_type": "code",
+        "metadata": {},
+        "source": (
+            "# Hidden states extraction test\n"
+            'prompt = "Hello world"\n'
+            "\n"
+            "with model.trace(prompt, remote=True):\n"
+            "    if hasattr(model, 'transformer'):\n"
+            "        layers = model.transformer.h\n"
+            "    elif hasattr(model, 'model') and hasattr(model.model, 'layers'):\n"
+            "        layers = model.model.layers\n"
+            "    elif hasattr(model, 'gpt_neox'):\n"
+            "        layers = model.gpt_neox.layers\n"
+            "    \n"
+            "    states = [layer.output[0].save() for layer in layers]\n"
+            "\n"
+            "print(f'Extracted {len(states)} layer states')\n"
+            "for i, s in enumerate(states[:3]):\n"
+            "    print(f'  Layer {i}: {s.shape}')\n"
+            "print('SUCCESS: Hidden states extraction works!')\n"
+        ),
+        "execution_count": None,
+        "outputs": []
+    },
+}
+
+
 def generate_reproducer_notebook(
     scenario: str,
     model: str,
@@ -38,148 +152,51 @@ def generate_reproducer_notebook(
 ) -> Dict[str, Any]:
     """Generate a Jupyter notebook for reproducing a failure.
 
-    Returns notebook as dict (can be saved as .ipynb).
+    Returns notebook as dict (can be saved as .ipynb). Static cells are
+    shared between notebooks, so treat the result as read-only.
     """
-    notebook_map = {
-        "basic_trace": "test_basic_trace.ipynb",
-        "generation": "test_generation.ipynb",
-        "hidden_states": "test_hidden_states.ipynb",
-    }
-    original_notebook = notebook_map.get(scenario, f"test_{scenario}.ipynb")
-
     cells = [
         {
             "cell_type": "markdown",
             "metadata": {},
-            "source": [
-                f"# NDIF Monitor - Reproducer for {model}\n",
-                f"\n",
-                f"**Scenario:** {scenario}\n",
-                f"\n",
-                f"This notebook reproduces a failure detected by NDIF Monitor.\n",
-                f"Run all cells to see the issue.\n",
-            ]
-        },
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Install dependencies\n",
-                "!pip install -q nnsight torch\n",
-            ],
-            "execution_count": None,
-            "outputs": []
-        },
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Set the model to test\n",
-                f'MODEL_NAME = "{model}"\n',
-                "print(f'Testing model: {MODEL_NAME}')\n",
-            ],
-            "execution_count": None,
-            "outputs": []
+            "source": (
+                f"# NDIF Monitor - Reproducer for {model}\n"
+                "\n"
+                f"**Scenario:** {scenario}\n"
+                "\n"
+                "This notebook reproduces a failure detected by NDIF Monitor.\n"
+                "Run all cells to see the issue.\n"
+            )
         },
+        _INSTALL_CELL,
         {
             "cell_type": "code",
             "metadata": {},
-            "source": [
-                "# Set up nnsight\n",
-                "import nnsight\n",
-                "from nnsight import LanguageModel\n",
-                "\n",
-                "# Configure API key (get from nnsight.net)\n",
-                "# nnsight.CONFIG.API.APIKEY = 'your-api-key'\n",
-                "\n",
-                f'model = LanguageModel(MODEL_NAME, device_map="auto")\n',
-            ],
+            "source": (
+                "# Set the model to test\n"
+                f'MODEL_NAME = "{model}"\n'
+                "print(f'Testing model: {MODEL_NAME}')\n"
+            ),
             "execution_count": None,
             "outputs": []
         },
+        _SETUP_CELL,
+        # Scenario-specific test code
+        *([_SCENARIO_CELLS[scenario]] if scenario in _SCENARIO_CELLS else []),
     ]
 
-    # Add scenario-specific test code
-    if scenario == "basic_trace":
-        cells.append({
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Basic trace test\n",
-                'prompt = "The quick brown fox"\n',
-                "\n",
-                "with model.trace(prompt, remote=True):\n",
-                "    # Try to access hidden states\n",
-                "    if hasattr(model, 'transformer'):\n",
-                "        hidden = model.transformer.h[0].output[0].save()\n",
-                "    elif hasattr(model, 'model') and hasattr(model.model, 'layers'):\n",
-                "        hidden = model.model.layers[0].output[0].save()\n",
-                "    elif hasattr(model, 'gpt_neox'):\n",
-                "        hidden = model.gpt_neox.layers[0].output[0].save()\n",
-                "\n",
-                "print(f'Hidden state shape: {hidden.shape}')\n",
-                "print('SUCCESS: Basic trace works!')\n",
-            ],
-            "execution_count": None,
-            "outputs": []
-        })
-    elif scenario == "generation":
-        cells.append({
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Generation test\n",
-                'prompt = "Once upon a time"\n',
-                "\n",
-                "with model.generate(prompt, max_new_tokens=20, remote=True):\n",
-                "    output = model.generator.output.save()\n",
-                "\n",
-                "generated = model.tokenizer.decode(output[0])\n",
-                "print(f'Generated: {generated}')\n",
-                "print('SUCCESS: Generation works!')\n",
-            ],
-            "execution_count": None,
-            "outputs": []
-        })
-    elif scenario == "hidden_states":
-        cells.append({
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Hidden states extraction test\n",
-                'prompt = "Hello world"\n',
-                "\n",
-                "with model.trace(prompt, remote=True):\n",
-                "    if hasattr(model, 'transformer'):\n",
-                "        layers = model.transformer.h\n",
-                "    elif hasattr(model, 'model') and hasattr(model.model, 'layers'):\n",
-                "        layers = model.model.layers\n",
-                "    elif hasattr(model, 'gpt_neox'):\n",
-                "        layers = model.gpt_neox.layers\n",
-                "    \n",
-                "    states = [layer.output[0].save() for layer in layers]\n",
-                "\n",
-                "print(f'Extracted {len(states)} layer states')\n",
-                "for i, s in enumerate(states[:3]):\n",
-                "    print(f'  Layer {i}: {s.shape}')\n",
-                "print('SUCCESS: Hidden states extraction works!')\n",
-            ],
-            "execution_count": None,
-            "outputs": []
-        })
-
     # Add error details if available
     if error_details:
         cells.append({
             "cell_type": "markdown",
             "metadata": {},
-            "source": [
-                "## Original Error\n",
-                "\n",
-                "```\n",
-                f"{error_details}\n",
-                "```\n",
-            ]
+            "source": (
+                "## Original Error\n"
+                "\n"
+                "```\n"
+                f"{error_details}\n"
+                "```\n"
+            )
         })
 
     return {
@@ -193,6 +210,202 @@ def generate_reproducer_notebook(
     }
 
 
+def _load_status_dict(path: str) -> Optional[Dict[str, Any]]:
+    """Load a model status file and return its to_dict() form."""
+    status = ModelStatus.load(path)
+    return status.to_dict() if status else None
+
+
+# Layout version of data/to_dict_cache.json entries. Bump it whenever
+# ModelStatus.to_dict() output changes so cached dicts are rebuilt.
+_TO_DICT_CACHE_VERSION = 1
+
+
+def _load_model_statuses(results_dir: Path) -> List[Dict[str, Any]]:
+    """Load every per-model status file in results_dir as to_dict() output.
+
+    Results are cached in data/to_dict_cache.json keyed by file name and
+    (st_mtime_ns, st_size), so only status files that changed since the last
+    dashboard build are parsed, in parallel. A cache written with another
+    _TO_DICT_CACHE_VERSION is discarded.
+    """
+    status_files = scan_model_status_files(results_dir)
+    cache_path = results_dir / "data" / "to_dict_cache.json"
+    try:
+        stored = _json_loads(cache_path.read_bytes())
+        if stored.get("version") != _TO_DICT_CACHE_VERSION:
+            raise ValueError("outdated cache layout")
+        cache = stored["files"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        cache = {}
+
+    fresh = {}
+    misses = []
+    for status_file in status_files:
+        name = status_file.name
+        try:
+            st = status_file.stat()
+        except FileNotFoundError:
+            continue
+        key = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(name)
+        if isinstance(entry, list) and len(entry) == 2 and entry[0] == key:
+            fresh[name] = entry
+        else:
+            misses.append((name, status_file.path, key))
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(STATUS_LOAD_WORKERS, len(misses))) as executor:
+            loaded = executor.map(_load_status_dict, [path for _, path, _ in misses])
+            for (name, _, key), data in zip(misses, loaded):
+                if data is not None:
+                    fresh[name] = [key, data]
+
+    if fresh != cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_if_changed(cache_path, _dumps_dashboard_data({
+            "version": _TO_DICT_CACHE_VERSION,
+            "files": fresh,
+        }))
+
+    return [data for _, data in fresh.values()]
+
+
+def _cached_daily_summary(
+    history: HistoryStore,
+    data_dir: Path,
+    days: int,
+) -> Tuple[Dict[str, Dict[str, Dict[str, Any]]], Dict[str, str]]:
+    """Get the daily summary, reusing days aggregated by earlier runs.
+
+    History is append-only, so once a day is over its summary no longer
+    changes. The summary is cached in data/daily_cache.json and only the
+    last cached day onwards is re-aggregated, or nothing at all if the
+    history file's size and mtime are unchanged. A cache built for another
+    `days` window, or for a history file that was rewritten (pruned or
+    replaced: its first line changed, it shrank or its mtime went back),
+    forces a full rebuild. The oldest day in the window is kept whole rather
+    than cut at the exact cutoff time.
+
+    Returns:
+        (daily summary, model -> last date with data), the latter kept up to
+        date from the re-aggregated days so callers need not scan the summary
+    """
+    cache_path = data_dir / "daily_cache.json"
+    try:
+        st = history.history_file.stat()
+        with open(history.history_file, "rb") as f:
+            history_head = hashlib.blake2b(f.readline(), digest_size=8).hexdigest()
+        history_size, history_mtime = st.st_size, st.st_mtime_ns
+    except FileNotFoundError:
+        history_head, history_size, history_mtime = "", 0, 0
+
+    cache = None
+    try:
+        cache = _json_loads(cache_path.read_bytes())
+        if (
+            cache.get("days") != days
+            or cache.get("history_head") != history_head
+            or cache.get("history_size", 0) > history_size
+            or cache.get("history_mtime", 0) > history_mtime
+            or not cache.get("daily")
+            or "last_seen" not in cache
+        ):
+            cache = None
+    except (OSError, ValueError, AttributeError):
+        cache = None
+
+    if cache is None:
+        daily = history.get_daily_summary(days=days)
+        last_seen: Dict[str, str] = {}
+        fresh = daily
+    elif cache["history_size"] == history_size and cache["history_mtime"] == history_mtime:
+        # Nothing was appended since the cache was written
+        daily = cache["daily"]
+        last_seen = cache["last_seen"]
+        fresh = {}
+    else:
+        # Re-aggregate from the day before the last cached one, in case that
+        # day was still in progress (or straddled midnight) when cached
+        last = datetime.fromisoformat(max(cache["daily"])).date()
+        since = (last - timedelta(days=1)).isoformat()
+        daily = {d: v for d, v in cache["daily"].items() if d < since}
+        last_seen = cache["last_seen"]
+        fresh = history.get_daily_summary_since(since, days=days)
+        daily.update(fresh)
+
+    for day in sorted(fresh):
+        for model in fresh[day]:
+            last_seen[model] = day
+
+    # Drop days (and models) that have aged out of the window
+    first = utc_to_eastern_date((datetime.utcnow() - timedelta(days=days)).isoformat() + "Z")
+    daily = {d: daily[d] for d in sorted(daily) if d >= first}
+    last_seen = {m: d for m, d in last_seen.items() if d >= first}
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(cache_path, _dumps_dashboard_data({
+        "days": days,
+        "history_head": history_head,
+        "history_size": history_size,
+        "history_mtime": history_mtime,
+        "daily": daily,
+        "last_seen": last_seen,
+    }))
+    return daily, last_seen
+
+
+def _eastern_display(dt: datetime) -> str:
+    """Format a naive UTC datetime as Eastern wall-clock time."""
+    return dt.replace(tzinfo=timezone.utc).astimezone(EASTERN).strftime("%Y-%m-%d %H:%M %Z")
+
+
+def _write_if_changed(path: Path, payload: bytes) -> bool:
+    """Atomically write payload to path unless it already holds exactly that.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    return True
+
+
+def _write_with_gzip(path: Path, payload: bytes) -> None:
+    """Write payload to path plus a precompressed path.gz companion.
+
+    Static hosts can serve the .gz file directly instead of compressing the
+    same content on every request. Unchanged content is neither rewritten
+    nor recompressed.
+    """
+    gz_path = path.with_name(path.name + ".gz")
+    if _write_if_changed(path, payload) or not gz_path.exists():
+        # mtime=0 keeps the gzip output reproducible for identical payloads
+        _write_if_changed(gz_path, gzip.compress(payload, compresslevel=6, mtime=0))
+
+
+def _add_time_fields(record: Dict[str, Any], key: str, now: datetime) -> None:
+    """Add "<key>_display" (Eastern time) and "<key>_ago" (seconds) fields.
+
+    Timestamps are formatted here once so the page never has to parse them.
+    """
+    timestamp = record.get(key)
+    if not timestamp:
+        return
+    try:
+        dt = datetime.fromisoformat(timestamp.rstrip("Z"))
+    except ValueError:
+        return
+    record[f"{key}_display"] = _eastern_display(dt)
+    record[f"{key}_ago"] = max(0, int((now - dt).total_seconds()))
+
+
 def generate_dashboard_html(
     history: HistoryStore,
     results_dir: Path,
@@ -210,51 +423,57 @@ def generate_dashboard_html(
     Returns:
         HTML string for the dashboard
     """
+    return _build_dashboard_page(history, results_dir, days, github_repo).decode()
+
+
+def _build_dashboard_page(
+    history: HistoryStore,
+    results_dir: Path,
+    days: int,
+    github_repo: str,
+) -> bytes:
+    """Write data/status.json and return the UTF-8 encoded dashboard page."""
     # Load data
-    daily_summary = history.get_daily_summary(days=days)
+    daily_summary, last_seen = _cached_daily_summary(history, results_dir / "data", days)
     recent_failures = history.get_recent_failures(days=7, limit=10)
 
     # Load current model statuses
-    model_statuses = []
-    for path in results_dir.glob("*.json"):
-        if path.name.startswith(".") or path.name.startswith("run_") or path.name == "dashboard_data.json":
-            continue
-        status = ModelStatus.load(str(path))
-        if status:
-            model_statuses.append(status)
-    model_statuses.sort(key=lambda s: s.model)
-
-    # Get all models that have ever been tested
-    all_models = set()
-    for date_data in daily_summary.values():
-        all_models.update(date_data.keys())
-    all_models = sorted(all_models)
+    model_statuses = _load_model_statuses(results_dir)
+    model_statuses.sort(key=operator.itemgetter("model"))
+
+    now = datetime.utcnow()
+    for status in model_statuses:
+        _add_time_fields(status, "last_updated", now)
+    failures = [dict(zip(_FAILURE_KEYS, _failure_fields(entry))) for entry in recent_failures]
+    for failure in failures:
+        _add_time_fields(failure, "timestamp", now)
+        # Last meaningful line of the error, shown before the row is expanded
+        lines = [line for line in (failure["details"] or "").split("\n") if line.strip()]
+        preview = lines[-1][:80] if lines else (failure["error_category"] or failure["status"])
+        if len(preview) >= 80:
+            preview += "..."
+        failure["error_preview"] = preview
 
     # Generate date range for last N days
-    today = datetime.utcnow().date()
-    dates = [(today - timedelta(days=i)).isoformat() for i in range(days - 1, -1, -1)]
+    dates = _date_range(now.toordinal(), days)
+
+    # Only models with data inside the shown range get a row; older days in
+    # the summary (and models seen only there) are left out of the payload
+    all_models = sorted(m for m, day in last_seen.items() if day >= dates[0])
 
     # Convert data to JSON for JavaScript
     dashboard_data = {
-        "generated": datetime.utcnow().isoformat() + "Z",
+        "generated": now,
+        "generated_display": _eastern_display(now),
         "host": get_hostname(),
         "user": get_username(),
         "days": days,
-        "dates": dates,
+        # The client rebuilds the date range from start_date + days
+        "start_date": dates[0],
         "models": all_models,
-        "daily": daily_summary,
-        "current": [s.to_dict() for s in model_statuses],
-        "failures": [
-            {
-                "timestamp": f.timestamp,
-                "model": f.model,
-                "scenario": f.scenario,
-                "status": f.status,
-                "error_category": f.error_category,
-                "details": f.details,
-            }
-            for f in recent_failures
-        ],
+        **_build_status_matrices(daily_summary, dates, all_models),
+        "current": model_statuses,
+        "failures": failures,
         "github_repo": github_repo,
     }
 
@@ -262,25 +481,113 @@ def generate_dashboard_html(
     data_dir = results_dir / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    data_path = data_dir / "status.json"
-    with open(data_path, "w") as f:
-        json.dump(dashboard_data, f, indent=2)
+    # Serialize once; the same compact JSON is saved and inlined in the page
+    data_json = _dumps_dashboard_data(dashboard_data)
+    _write_with_gzip(data_dir / "status.json", data_json)
+    _write_assets(data_dir)
 
-    return _generate_html(dashboard_data)
+    return _generate_html(data_json)
 
 
-def _generate_html(data: Dict[str, Any]) -> str:
-    """Generate the HTML content."""
-    # Use a simpler approach - no f-string escaping needed
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>NDIF Monitor</title>
-    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🔬</text></svg>">
-    <style>
-        :root {
+# Status codes for the calendar matrices, in increasing severity, so the
+# worst of several statuses is simply the highest code ("0" = no data).
+STATUS_CODES = ["", "COLD", "OK", "SLOW", "DEGRADED", "FAILED", "UNAVAILABLE"]
+_STATUS_CODE_BYTES = {name: ord("0") + i for i, name in enumerate(STATUS_CODES) if name}
+
+
+@lru_cache(maxsize=4)
+def _date_range(end_ordinal: int, days: int) -> Tuple[str, ...]:
+    """ISO dates of the `days` days ending on the given proleptic ordinal."""
+    return tuple(date.fromordinal(o).isoformat() for o in range(end_ordinal - days + 1, end_ordinal + 1))
+
+
+def _build_status_matrices(
+    daily: Dict[str, Dict[str, Dict[str, Any]]],
+    dates: Tuple[str, ...],
+    models: List[str],
+) -> Dict[str, Any]:
+    """Flatten the daily summary into strings of one-digit status codes.
+
+    With D dates, M models and 24 hours per day:
+    - status_matrix[d*M + m]: day status of model m on date d
+    - worst[d]: worst day status over all models
+    - hours_matrix[(d*M + m)*24 + h]: status of model m in hour h
+    - worst_hours[d*24 + h]: worst status over all models in hour h
+    """
+    n_models = len(models)
+    model_index = {m: i for i, m in enumerate(models)}
+    no_data = ord("0")
+    status_matrix = bytearray([no_data]) * (len(dates) * n_models)
+    hours_matrix = bytearray([no_data]) * (len(dates) * n_models * 24)
+    worst = bytearray([no_data]) * len(dates)
+    worst_hours = bytearray([no_data]) * (len(dates) * 24)
+
+    for d, day in enumerate(dates):
+        for model, data in daily.get(day, {}).items():
+            cell = d * n_models + model_index[model]
+            code = _STATUS_CODE_BYTES.get(data.get("status"), no_data)
+            status_matrix[cell] = code
+            worst[d] = max(worst[d], code)
+            for hour, hour_status in data.get("hours", {}).items():
+                h = int(hour)
+                code = _STATUS_CODE_BYTES.get(hour_status, no_data)
+                hours_matrix[cell * 24 + h] = code
+                worst_hours[d * 24 + h] = max(worst_hours[d * 24 + h], code)
+
+    return {
+        "status_codes": STATUS_CODES,
+        "status_matrix": status_matrix.decode("ascii"),
+        "worst": worst.decode("ascii"),
+        "hours_matrix": hours_matrix.decode("ascii"),
+        "worst_hours": worst_hours.decode("ascii"),
+    }
+
+
+# HistoryEntry fields shown in the failures table
+_FAILURE_KEYS = ("timestamp", "model", "scenario", "status", "error_category", "details")
+_failure_fields = operator.attrgetter(*_FAILURE_KEYS)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode result objects that appear in the dashboard data."""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + "Z"
+    if isinstance(obj, ModelStatus):
+        return obj.to_dict()
+    if isinstance(obj, HistoryEntry):
+        return dict(zip(_FAILURE_KEYS, _failure_fields(obj)))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_dashboard_data(data: Dict[str, Any]) -> bytes:
+    """Serialize dashboard data (or its caches) to compact UTF-8 JSON.
+
+    Naive datetimes are UTC and are written as RFC 3339 with a "Z" suffix.
+    """
+    if orjson is not None:
+        # Route dataclasses through _json_default rather than orjson's own encoding
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NAIVE_UTC
+            | orjson.OPT_UTC_Z
+        )
+        return orjson.dumps(data, default=_json_default, option=options)
+    return json.dumps(data, default=_json_default, separators=(",", ":")).encode()
+
+
+def _strip_indentation(text: str) -> str:
+    """Drop leading whitespace and blank lines from page source kept at import.
+
+    The page, stylesheet and script contain no <pre> text or multi-line
+    string literals, so the indentation only costs bytes on the wire.
+    """
+    return re.sub(r"^\s+", "", text, flags=re.MULTILINE)
+
+
+# Dashboard styles, written to data/ under a content-hashed name so browsers
+# can cache them across reloads and pick up changes automatically.
+_DASHBOARD_CSS = _strip_indentation("""        :root {
             --ok: #10b981;
             --slow: #f59e0b;
             --degraded: #f97316;
@@ -535,6 +842,9 @@ def _generate_html(data: Dict[str, Any]) -> str:
             border-radius: 0.5rem;
             padding: 1rem 1.25rem;
             transition: border-color 0.15s;
+            /* Off-screen cards skip layout and paint until scrolled near */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 12rem;
         }
         .model-card:hover { border-color: var(--text-muted); }
         .model-card-header {
@@ -780,136 +1090,32 @@ def _generate_html(data: Dict[str, Any]) -> str:
         }
         footer a { color: var(--text-secondary); }
 
-        /* Loading */
-        .loading {
-            text-align: center;
-            padding: 4rem 2rem;
-            color: var(--text-muted);
-        }
-        .loading-spinner {
-            width: 24px;
-            height: 24px;
-            border: 2px solid var(--border);
-            border-top-color: var(--accent);
-            border-radius: 50%;
-            animation: spin 0.8s linear infinite;
-            margin: 0 auto 1rem;
-        }
-        @keyframes spin { to { transform: rotate(360deg); } }
-
         @media (max-width: 640px) {
             .container { padding: 0 1rem; }
             .summary { gap: 1.5rem; }
             .stat-value { font-size: 2rem; }
             .model-grid { grid-template-columns: 1fr; }
         }
-    </style>
-</head>
-<body>
-    <div class="stale-banner" id="staleBanner">
-        <strong>Warning:</strong> Monitor data is stale. The monitoring system may be down.
-        <span id="staleTime"></span>
-    </div>
-    <header>
-        <div class="container">
-            <div class="header-inner">
-                <div class="header-title">
-                    <h1>NDIF Monitor</h1>
-                    <p>End-to-end testing of <a href="https://nnsight.net" target="_blank">nnsight</a> + <a href="https://ndif.us" target="_blank">NDIF</a></p>
-                </div>
-                <div class="header-meta">
-                    <div>Updated: <span id="updated">-</span></div>
-                    <div>nnsight <span class="version" id="version">-</span></div>
-                    <div id="hostInfo"></div>
-                </div>
-            </div>
-        </div>
-    </header>
+""")
+CSS_FILENAME = f"dashboard.{hashlib.blake2b(_DASHBOARD_CSS.encode(), digest_size=8).hexdigest()}.css"
 
-    <main class="container">
-        <div class="summary" id="summary">
-            <div class="stat"><span class="stat-value total" id="statTotal">-</span><span class="stat-label">Models</span></div>
-            <div class="stat"><span class="stat-value ok" id="statOk">-</span><span class="stat-label">OK</span></div>
-            <div class="stat"><span class="stat-value slow" id="statSlow">-</span><span class="stat-label">Slow</span></div>
-            <div class="stat"><span class="stat-value failed" id="statFailed">-</span><span class="stat-label">Failed</span></div>
-        </div>
 
-        <section>
-            <div class="section-header">
-                <h2>Status History</h2>
-                <div style="display:flex;gap:1rem;align-items:center;flex-wrap:wrap">
-                    <div class="legend">
-                        <div class="legend-item"><div class="legend-dot ok"></div>OK</div>
-                        <div class="legend-item"><div class="legend-dot slow"></div>Slow</div>
-                        <div class="legend-item"><div class="legend-dot failed"></div>Failed</div>
-                        <div class="legend-item"><div class="legend-dot cold"></div>Cold</div>
-                        <div class="legend-item"><div class="legend-dot empty"></div>No data</div>
-                    </div>
-                    <div class="model-filter">
-                        <select id="modelSelect">
-                            <option value="__all__">All models</option>
-                        </select>
-                    </div>
-                </div>
-            </div>
-            <div class="calendar-wrapper">
-                <div class="calendar-container">
-                    <div class="calendar-months" id="calendarMonths"></div>
-                    <div class="calendar" id="calendar"></div>
-                </div>
-            </div>
-            <div class="calendar-resize" id="calendarResize">
-                <div class="resize-handle"></div>
-                <span class="resize-label" id="resizeLabel">6h segments</span>
-            </div>
-        </section>
-
-        <section>
-            <div class="section-header">
-                <h2>Current Status</h2>
-            </div>
-            <div class="model-grid" id="modelGrid"></div>
-        </section>
-
-        <section>
-            <div class="section-header">
-                <h2>Recent Failures</h2>
-            </div>
-            <table class="failures-table">
-                <thead>
-                    <tr>
-                        <th>Time</th>
-                        <th>Model</th>
-                        <th>Test</th>
-                        <th>Error</th>
-                        <th></th>
-                    </tr>
-                </thead>
-                <tbody id="failuresBody"></tbody>
-            </table>
-        </section>
-    </main>
-
-    <footer>
-        <div class="container">
-            <a href="https://github.com/davidbau/ndif-monitor" target="_blank">GitHub</a> ·
-            <a href="https://nnsight.net/documentation" target="_blank">nnsight docs</a> ·
-            <a href="https://ndif.us" target="_blank">NDIF</a>
-        </div>
-    </footer>
-
-    <div class="tooltip" id="tooltip" style="display:none"></div>
-    <div class="loading" id="loading">
-        <div class="loading-spinner"></div>
-        Loading dashboard data...
-    </div>
-
-    <script>
-        let DATA = null;
-        let granularity = 4;  // Number of segments to show per day
+# Dashboard script, written next to the stylesheet in the same way. It runs
+# after the inline script that defines DATA.
+_DASHBOARD_JS = _strip_indentation("""        let granularity = 4;  // Number of segments to show per day
         const GRANULARITY_LEVELS = [1, 2, 3, 4, 6, 8, 12, 24];
         const GRANULARITY_LABELS = {1: 'Daily', 2: '12h', 3: '8h', 4: '6h', 6: '4h', 8: '3h', 12: '2h', 24: '1h'};
 
+        // Elements touched on every render or hover, looked up once; the
+        // script runs after the markup, so they already exist
+        const modelSelect = document.getElementById('modelSelect');
+        const calendarEl = document.getElementById('calendar');
+        const calendarMonthsEl = document.getElementById('calendarMonths');
+        const resizeLabel = document.getElementById('resizeLabel');
+        const modelGrid = document.getElementById('modelGrid');
+        const failuresBody = document.getElementById('failuresBody');
+        const tooltip = document.getElementById('tooltip');
+
         // Threshold for SLOW status (ms) - determined at analysis time
         const SLOW_THRESHOLD_MS = 35000;  // 35 seconds
 
@@ -927,35 +1133,36 @@ def _generate_html(data: Dict[str, Any]) -> str:
 
         // Compute overall status from scenario statuses
         function computeOverallStatus(scenarios) {
-            const statuses = Object.entries(scenarios || {}).map(([k, v]) =>
-                getEffectiveStatus(v.status, k, v.duration_ms)
-            );
-            if (statuses.includes('FAILED') || statuses.includes('UNAVAILABLE')) return 'FAILED';
-            if (statuses.includes('DEGRADED')) return 'DEGRADED';
-            if (statuses.includes('SLOW')) return 'SLOW';
-            if (statuses.every(s => s === 'COLD')) return 'COLD';
-            return statuses.length ? 'OK' : 'UNKNOWN';
-        }
-
-        async function loadData() {
-            try {
-                const res = await fetch('data/status.json');
-                if (!res.ok) throw new Error('Failed to load');
-                DATA = await res.json();
-                document.getElementById('loading').style.display = 'none';
-                render();
-                setupResizeHandle();
-            } catch (e) {
-                document.getElementById('loading').innerHTML =
-                    '<div style="color:var(--failed)">Error loading data</div><div style="margin-top:0.5rem">' + e.message + '</div>';
+            let failed = false, degraded = false, slow = false, allCold = true;
+            for (const k in scenarios) {
+                const v = scenarios[k];
+                const s = getEffectiveStatus(v.status, k, v.duration_ms);
+                if (s === 'FAILED' || s === 'UNAVAILABLE') failed = true;
+                else if (s === 'DEGRADED') degraded = true;
+                else if (s === 'SLOW') slow = true;
+                if (s !== 'COLD') allCold = false;
             }
+            if (failed) return 'FAILED';
+            if (degraded) return 'DEGRADED';
+            if (slow) return 'SLOW';
+            // No scenarios at all also counts as COLD
+            if (allCold) return 'COLD';
+            return 'OK';
+        }
+
+        function initDashboard() {
+            render();
+            setupResizeHandle();
+            setupCalendarTips();
+            setupErrorTips();
+            setupFailureDetails();
         }
 
         // Check if data is stale (older than 1 hour)
         const STALE_THRESHOLD_MS = 60 * 60 * 1000;  // 1 hour
 
         function checkStale() {
-            if (!DATA || !DATA.generated) return;
+            if (!DATA.generated) return;
             const generated = new Date(DATA.generated);
             const age = Date.now() - generated.getTime();
             if (age > STALE_THRESHOLD_MS) {
@@ -974,7 +1181,7 @@ def _generate_html(data: Dict[str, Any]) -> str:
             checkStale();
 
             // Header info
-            document.getElementById('updated').textContent = formatTime(DATA.generated);
+            document.getElementById('updated').textContent = DATA.generated_display;
             if (DATA.nnsight_version) {
                 document.getElementById('version').textContent = 'v' + DATA.nnsight_version;
             }
@@ -987,25 +1194,23 @@ def _generate_html(data: Dict[str, Any]) -> str:
             const stats = {total: 0, ok: 0, slow: 0, failed: 0};
             DATA.current.forEach(m => {
                 stats.total++;
-                const s = computeOverallStatus(m.scenarios).toLowerCase();
-                if (s === 'ok') stats.ok++;
-                else if (s === 'slow') stats.slow++;
-                else if (s === 'failed' || s === 'unavailable' || s === 'degraded') stats.failed++;
+                const s = computeOverallStatus(m.scenarios);
+                if (s === 'OK') stats.ok++;
+                else if (s === 'SLOW') stats.slow++;
+                else if (s === 'FAILED' || s === 'UNAVAILABLE' || s === 'DEGRADED') stats.failed++;
             });
             document.getElementById('statTotal').textContent = stats.total;
             document.getElementById('statOk').textContent = stats.ok;
             document.getElementById('statSlow').textContent = stats.slow;
             document.getElementById('statFailed').textContent = stats.failed;
 
-            // Model selector
-            const select = document.getElementById('modelSelect');
-            DATA.models.forEach(m => {
-                const opt = document.createElement('option');
-                opt.value = m;
-                opt.textContent = m.split('/').pop();
-                select.appendChild(opt);
-            });
-            select.onchange = () => renderCalendar(select.value);
+            // Model selector, added after the "All models" option in one insertion
+            let options = '';
+            for (const m of DATA.models) {
+                options += '<option value="' + esc(m) + '">' + shortName(m) + '</option>';
+            }
+            modelSelect.insertAdjacentHTML('beforeend', options);
+            modelSelect.onchange = scheduleCalendarRender;
 
             renderCalendar('__all__');
             renderModels();
@@ -1015,7 +1220,8 @@ def _generate_html(data: Dict[str, Any]) -> str:
         function setupResizeHandle() {
             const handle = document.getElementById('calendarResize');
             let startY = 0;
-            let startGranularity = granularity;
+            let startHeight = 0;
+            let levelHeights = [];
 
             // Calculate calendar height for a given granularity
             function calcHeight(g) {
@@ -1025,17 +1231,24 @@ def _generate_html(data: Dict[str, Any]) -> str:
                 return dayHeight * 7;  // 7 days per week column
             }
 
+            // Heights only depend on the window width, so they are measured
+            // once when a drag starts rather than on every move
+            function startDrag(y) {
+                startY = y;
+                startHeight = calcHeight(granularity);
+                levelHeights = GRANULARITY_LEVELS.map(calcHeight);
+            }
+
             function onMove(e) {
                 const dy = (e.clientY || e.touches[0].clientY) - startY;
                 // Target height = start height + drag distance
-                const startHeight = calcHeight(startGranularity);
                 const targetHeight = startHeight + dy;
 
                 // Find the granularity level closest to target height
-                let bestLevel = startGranularity;
+                let bestLevel = granularity;
                 let bestDiff = Infinity;
-                GRANULARITY_LEVELS.forEach(level => {
-                    const diff = Math.abs(calcHeight(level) - targetHeight);
+                GRANULARITY_LEVELS.forEach((level, i) => {
+                    const diff = Math.abs(levelHeights[i] - targetHeight);
                     if (diff < bestDiff) {
                         bestDiff = diff;
                         bestLevel = level;
@@ -1045,7 +1258,7 @@ def _generate_html(data: Dict[str, Any]) -> str:
                 if (bestLevel !== granularity) {
                     granularity = bestLevel;
                     updateResizeLabel();
-                    renderCalendar(document.getElementById('modelSelect').value);
+                    scheduleCalendarRender();
                 }
             }
 
@@ -1057,200 +1270,233 @@ def _generate_html(data: Dict[str, Any]) -> str:
             }
 
             handle.addEventListener('mousedown', e => {
-                startY = e.clientY;
-                startGranularity = granularity;
+                startDrag(e.clientY);
                 document.addEventListener('mousemove', onMove);
                 document.addEventListener('mouseup', onEnd);
             });
             handle.addEventListener('touchstart', e => {
-                startY = e.touches[0].clientY;
-                startGranularity = granularity;
+                startDrag(e.touches[0].clientY);
                 document.addEventListener('touchmove', onMove);
                 document.addEventListener('touchend', onEnd);
             });
         }
 
         function updateResizeLabel() {
-            document.getElementById('resizeLabel').textContent = GRANULARITY_LABELS[granularity] + ' segments';
+            resizeLabel.textContent = GRANULARITY_LABELS[granularity] + ' segments';
+        }
+
+        // Status matrices are strings of one-digit codes in increasing severity
+        // (see status_codes), so the worst of several statuses is the max code.
+        const NUM_MODELS = DATA.models.length;
+        const DAY_MS = 86400000;
+        const START_EPOCH = Date.parse(DATA.start_date + 'T00:00:00Z');
+        const START_DOW = new Date(START_EPOCH).getUTCDay();
+        const DATES = Array.from({length: DATA.days}, (_, i) => new Date(START_EPOCH + i * DAY_MS).toISOString().slice(0, 10));
+        const DATE_INDEX = new Map(DATES.map((d, i) => [d, i]));
+        const MODEL_INDEX = new Map(DATA.models.map((m, i) => [m, i]));
+        // Full class name of a calendar segment per status code; UNAVAILABLE is drawn as FAILED
+        const SEGMENT_CLASSES = DATA.status_codes.map(s =>
+            'calendar-segment' + (s ? ' ' + (s === 'UNAVAILABLE' ? 'failed' : s.toLowerCase()) : ''));
+        // Nothing is worse than the last code, so scans can stop once they see it
+        const MAX_CODE = DATA.status_codes.length - 1;
+
+        // Where a model's hourly codes live (model = '__all__' for all models):
+        // hour h of day d is codes[base + d * stride + h]. Resolved once per
+        // render or tooltip rather than once per hour; null = model has no data.
+        function hourRow(model) {
+            if (model === '__all__') return {codes: DATA.worst_hours, base: 0, stride: 24};
+            const m = MODEL_INDEX.get(model);
+            if (m === undefined) return null;
+            return {codes: DATA.hours_matrix, base: m * 24, stride: NUM_MODELS * 24};
+        }
+
+        // Worst status code over hours [startHour, endHour) of a day, 0 = no data
+        function worstInHours(row, dateIdx, startHour, endHour) {
+            if (!row) return 0;
+            const offset = row.base + dateIdx * row.stride;
+            let worst = 0;
+            for (let h = startHour; h < endHour && worst < MAX_CODE; h++) {
+                worst = Math.max(worst, row.codes.charCodeAt(offset + h) - 48);
+            }
+            return worst;
         }
 
-        // Get segment statuses for a date and model, aggregated to current granularity
-        function getSegmentStatuses(date, model) {
-            if (!DATA.daily[date]) return Array(granularity).fill(null);
+        // DATA.worst is the precomputed all-models rollup per day ('0' = no tests)
+        function hasData(date) {
+            const d = DATE_INDEX.get(date);
+            return d !== undefined && DATA.worst[d] !== '0';
+        }
 
-            // Map from 24 hourly slots to current granularity
+        // Class name of one segment of a day for a resolved hourRow, with the
+        // day's 24 hourly slots grouped to the current granularity. Returning
+        // one string per segment avoids allocating an array per day.
+        function segmentClass(dateIdx, row, segmentIdx) {
+            if (DATA.worst[dateIdx] === '0') return SEGMENT_CLASSES[0];
             const hoursPerSegment = 24 / granularity;
-            const result = [];
-
-            for (let i = 0; i < granularity; i++) {
-                const bucketStatuses = [];
-                for (let j = 0; j < hoursPerSegment; j++) {
-                    const hour = Math.floor(i * hoursPerSegment + j);
-                    if (model === '__all__') {
-                        // Aggregate across all models
-                        Object.values(DATA.daily[date]).forEach(m => {
-                            if (m.hours && m.hours[hour]) {
-                                bucketStatuses.push(m.hours[hour]);
-                            }
-                        });
-                    } else {
-                        const d = DATA.daily[date][model];
-                        if (d && d.hours && d.hours[hour]) {
-                            bucketStatuses.push(d.hours[hour]);
-                        }
-                    }
-                }
-                // Compute worst status for this bucket
-                if (bucketStatuses.length === 0) result.push(null);
-                else if (bucketStatuses.includes('FAILED') || bucketStatuses.includes('UNAVAILABLE')) result.push('FAILED');
-                else if (bucketStatuses.includes('DEGRADED')) result.push('DEGRADED');
-                else if (bucketStatuses.includes('SLOW')) result.push('SLOW');
-                else if (bucketStatuses.every(s => s === 'COLD')) result.push('COLD');
-                else result.push('OK');
-            }
-            return result;
-        }
-
-        // Get overall status for a date (for tooltip)
-        function getStatus(date, model) {
-            if (!DATA.daily[date]) return null;
-            if (model === '__all__') {
-                const statuses = Object.values(DATA.daily[date]).map(m => m.status);
-                if (statuses.includes('FAILED') || statuses.includes('UNAVAILABLE')) return 'FAILED';
-                if (statuses.includes('DEGRADED')) return 'DEGRADED';
-                if (statuses.includes('SLOW')) return 'SLOW';
-                if (statuses.every(s => s === 'COLD')) return 'COLD';
-                return statuses.length ? 'OK' : null;
-            }
-            const d = DATA.daily[date][model];
-            return d ? d.status : null;
+            const start = segmentIdx * hoursPerSegment;
+            return SEGMENT_CLASSES[worstInHours(row, dateIdx, start, start + hoursPerSegment)];
         }
 
-        function renderCalendar(model) {
-            const cal = document.getElementById('calendar');
-            const monthsEl = document.getElementById('calendarMonths');
-            cal.innerHTML = '';
-            monthsEl.innerHTML = '';
-            updateResizeLabel();
-
-            const weeks = [];
+        // Week layout (day indices per week) and month label positions depend
+        // only on the date range, so they are computed once
+        const MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+        const CALENDAR_WEEKS = [];
+        const MONTH_STARTS = [];
+        (function () {
             let week = [];
-            const monthNames = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-
-            // Track month boundaries for labels
-            const monthStarts = [];
             let currentMonth = null;
-
-            DATA.dates.forEach((date, i) => {
-                const d = new Date(date + 'T00:00:00Z');
-                const month = d.getUTCMonth();
-                const year = d.getUTCFullYear();
+            // Month and year come straight from the precomputed YYYY-MM-DD strings
+            for (let i = 0; i < DATES.length; i++) {
+                const month = +DATES[i].slice(5, 7) - 1;
+                const year = +DATES[i].slice(0, 4);
 
                 if (currentMonth !== month) {
-                    monthStarts.push({weekIndex: weeks.length, month, year});
+                    MONTH_STARTS.push({weekIndex: CALENDAR_WEEKS.length, month, year});
                     currentMonth = month;
                 }
 
-                if (d.getUTCDay() === 0 && week.length) {
-                    weeks.push(week);
+                if ((START_DOW + i) % 7 === 0 && week.length) {
+                    CALENDAR_WEEKS.push(week);
                     week = [];
                 }
-                week.push(date);
-            });
-            if (week.length) weeks.push(week);
+                week.push(i);
+            }
+            if (week.length) CALENDAR_WEEKS.push(week);
+        })();
+
+        // Segment elements per day index, and the layout they were built for
+        let daySegments = [];
+        let calendarLayout = null;
+
+        function renderCalendar(model) {
+            updateResizeLabel();
 
             // Compute sizes based on granularity
             const segSize = Math.min(Math.max(window.innerWidth * 0.003, 3), 4);
-            const dayGap = 1;
             const weekGap = Math.min(Math.max(window.innerWidth * 0.003, 2), 4);
-            const dayWidth = segSize * granularity + dayGap;
-            const weekWidth = dayWidth + weekGap;
 
-            // Apply CSS custom properties
-            cal.style.gap = weekGap + 'px';
-            document.querySelectorAll('.calendar-week').forEach(w => w.style.gap = dayGap + 'px');
-
-            // Render month labels
-            monthStarts.forEach((ms, i) => {
-                const label = document.createElement('span');
-                label.className = 'calendar-month';
-                const nextStart = (i + 1 < monthStarts.length) ? monthStarts[i + 1].weekIndex : weeks.length;
-                const width = (nextStart - ms.weekIndex) * weekWidth;
-                label.style.width = width + 'px';
-                label.textContent = monthNames[ms.month];
-                monthsEl.appendChild(label);
+            // The DOM is only rebuilt (with the segment classes in its markup)
+            // when the layout changes; switching models just recolors the
+            // existing segments
+            const row = hourRow(model);
+            const layout = granularity + '|' + segSize + '|' + weekGap;
+            if (layout !== calendarLayout) {
+                buildCalendar(segSize, weekGap, row);
+                calendarLayout = layout;
+                return;
+            }
+
+            for (let i = 0; i < DATES.length; i++) {
+                const segs = daySegments[i];
+                for (let j = 0; j < segs.length; j++) segs[j].className = segmentClass(i, row, j);
+            }
+        }
+
+        // Model changes and resize drags can fire several times per frame;
+        // they share one pending render that reads the latest state
+        let calendarFrame = 0;
+        function scheduleCalendarRender() {
+            if (calendarFrame) return;
+            calendarFrame = requestAnimationFrame(() => {
+                calendarFrame = 0;
+                renderCalendar(modelSelect.value);
             });
+        }
 
-            // Render weeks
-            weeks.forEach(w => {
-                const weekEl = document.createElement('div');
-                weekEl.className = 'calendar-week';
-                weekEl.style.gap = dayGap + 'px';
-
-                // Pad first week
-                const first = new Date(w[0] + 'T00:00:00Z').getUTCDay();
-                for (let i = 0; i < first; i++) {
-                    const pad = document.createElement('div');
-                    pad.className = 'calendar-day';
-                    pad.style.width = dayWidth + 'px';
-                    pad.style.height = dayWidth + 'px';
-                    weekEl.appendChild(pad);
+        function buildCalendar(segSize, weekGap, row) {
+            const dayGap = 1;
+            const dayWidth = segSize * granularity + dayGap;
+            const weekWidth = dayWidth + weekGap;
+
+            // Month labels and weeks are built as strings in one pass over the
+            // weeks, then both containers are written together
+            let months = '';
+            let nextMonth = 0;
+            const padHtml = '<div class="calendar-day" style="width:' + dayWidth + 'px;height:' + dayWidth + 'px"></div>';
+            const segStyle = 'width:' + segSize + 'px;height:' + dayWidth + 'px';
+            const parts = [];
+            CALENDAR_WEEKS.forEach((w, weekIdx) => {
+                // Each month label spans from its first week to the next month's
+                for (; nextMonth < MONTH_STARTS.length && MONTH_STARTS[nextMonth].weekIndex === weekIdx; nextMonth++) {
+                    const end = nextMonth + 1 < MONTH_STARTS.length ? MONTH_STARTS[nextMonth + 1].weekIndex : CALENDAR_WEEKS.length;
+                    months += '<span class="calendar-month" style="width:' + (end - weekIdx) * weekWidth + 'px">' +
+                              MONTH_NAMES[MONTH_STARTS[nextMonth].month] + '</span>';
                 }
 
-                w.forEach(date => {
-                    const day = document.createElement('div');
-                    day.className = 'calendar-day';
-                    day.dataset.date = date;
-                    day.style.gap = '0';
-
-                    // Get segment statuses for this date
-                    const segmentStatuses = getSegmentStatuses(date, model);
-
-                    // Create segment elements
-                    segmentStatuses.forEach((status, idx) => {
-                        const seg = document.createElement('div');
-                        seg.className = 'calendar-segment';
-                        seg.style.width = segSize + 'px';
-                        seg.style.height = dayWidth + 'px';
-                        if (status) seg.classList.add(status.toLowerCase());
-                        // Add data for segment-level tooltip
-                        seg.dataset.date = date;
-                        seg.dataset.segmentIdx = idx;
-                        seg.onmouseenter = showSegmentTip;
-                        seg.onmouseleave = hideTip;
-                        day.appendChild(seg);
-                    });
-
-                    weekEl.appendChild(day);
+                parts.push('<div class="calendar-week" style="gap:' + dayGap + 'px">');
+
+                // Only the first week can start mid-week; pad it up to the start date
+                if (weekIdx === 0) parts.push(padHtml.repeat(START_DOW));
+
+                w.forEach(i => {
+                    const date = DATES[i];
+                    parts.push('<div class="calendar-day" data-date="' + date + '" style="gap:0">');
+                    // Segments carry their date and index for the segment-level tooltip
+                    for (let idx = 0; idx < granularity; idx++) {
+                        parts.push('<div class="' + segmentClass(i, row, idx) + '" data-date="' + date +
+                                   '" data-segment-idx="' + idx + '" style="' + segStyle + '"></div>');
+                    }
+                    parts.push('</div>');
                 });
-                cal.appendChild(weekEl);
+                parts.push('</div>');
             });
+            calendarMonthsEl.innerHTML = months;
+            calendarEl.style.gap = weekGap + 'px';
+            calendarEl.innerHTML = parts.join('');
+
+            daySegments = [];
+            const days = calendarEl.querySelectorAll('.calendar-day[data-date]');
+            for (let i = 0; i < days.length; i++) daySegments[i] = days[i].children;
+        }
+
+        // Model names can come from the NDIF status API and error text from
+        // arbitrary exceptions, so both are escaped before going into markup
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'};
+        function esc(s) {
+            return s.replace(/[&<>"]/g, c => HTML_ESCAPES[c]);
+        }
+
+        // Escaped display name of a model without its org ('org/name' -> 'name'),
+        // computed once per model
+        const shortNames = new Map();
+        function shortName(model) {
+            let name = shortNames.get(model);
+            if (name === undefined) {
+                name = esc(model.slice(model.lastIndexOf('/') + 1));
+                shortNames.set(model, name);
+            }
+            return name;
         }
 
-        // Helper to get model folder name for Colab notebook paths
-        function getModelFolder(model) {
-            return model.replace('/', '--');
-        }
+        // Colab notebook folder URL per model ('org/name' -> 'org--name'),
+        // built once per model rather than once per link
+        const COLAB_URL_PREFIX = 'https://colab.research.google.com/github/' + DATA.github_repo +
+                                 '/blob/main/notebooks/colab/';
+        const colabFolderUrls = new Map();
 
         // Helper to build Colab URL for model-specific notebooks
         function getColabUrl(model, scenario) {
-            const folder = getModelFolder(model);
-            return 'https://colab.research.google.com/github/' + DATA.github_repo +
-                   '/blob/main/notebooks/colab/' + folder + '/' + scenario + '.ipynb';
+            let folderUrl = colabFolderUrls.get(model);
+            if (folderUrl === undefined) {
+                folderUrl = COLAB_URL_PREFIX + model.replace('/', '--') + '/';
+                colabFolderUrls.set(model, folderUrl);
+            }
+            return folderUrl + scenario + '.ipynb';
         }
 
         function renderModels() {
-            const grid = document.getElementById('modelGrid');
-            grid.innerHTML = '';
+            let html = '';
 
-            DATA.current.forEach(m => {
+            for (let idx = 0; idx < DATA.current.length; idx++) {
+                const m = DATA.current[idx];
                 // Compute overall status from scenarios (applies SLOW thresholds)
                 const overallStatus = computeOverallStatus(m.scenarios);
                 const st = overallStatus.toLowerCase();
-                const [org, name] = m.model.includes('/') ? m.model.split('/') : ['', m.model];
+                const org = m.model.slice(0, Math.max(m.model.lastIndexOf('/'), 0));
 
                 let scenarios = '';
-                Object.entries(m.scenarios || {}).forEach(([k, v]) => {
+                for (const k in m.scenarios) {
+                    const v = m.scenarios[k];
                     const dur = v.duration_ms ? (v.duration_ms / 1000).toFixed(1) + 's' : '';
                     // Apply SLOW threshold to each scenario
                     const effectiveStatus = getEffectiveStatus(v.status, k, v.duration_ms);
@@ -1258,10 +1504,8 @@ def _generate_html(data: Dict[str, Any]) -> str:
                     const hasError = v.status === 'FAILED' && v.details;
                     const errorClass = hasError ? ' has-error' : '';
                     const errorHint = hasError ? '<span class="scenario-error-hint" title="Click for details">ⓘ</span>' : '';
-                    // Store error data for tooltip
-                    const errorData = hasError ? ' data-error-category="' + (v.error_category || 'ERROR').replace(/"/g, '&quot;') +
-                        '" data-error-details="' + (v.details || '').replace(/"/g, '&quot;').replace(/</g, '&lt;') +
-                        '" data-model="' + m.model + '" data-scenario="' + k + '"' : '';
+                    // Tooltip text is looked up in DATA.current by card index and scenario
+                    const errorData = hasError ? ' data-idx="' + idx + '" data-scenario="' + k + '"' : '';
                     scenarios += '<div class="scenario-row' + errorClass + '"' + errorData + '>' +
                         '<span class="scenario-name-group">' +
                         '<span class="scenario-label">' + k + '</span>' + errorHint +
@@ -1271,104 +1515,86 @@ def _generate_html(data: Dict[str, Any]) -> str:
                         '<span class="scenario-time">' + dur + '</span>' +
                         '<span class="status-dot ' + effectiveStatus.toLowerCase() + '"></span>' +
                         '</span></div>';
-                });
+                }
 
-                const updated = m.last_updated ? formatTimeAgo(m.last_updated) : '-';
+                const updated = m.last_updated_ago != null ? formatAgo(m.last_updated_ago) : '-';
 
-                const card = document.createElement('div');
-                card.className = 'model-card';
-                card.innerHTML =
+                html += '<div class="model-card">' +
                     '<div class="model-card-header">' +
-                    '<div class="model-name">' + (org ? '<span class="org">' + org + '/</span>' : '') + name + '</div>' +
+                    '<div class="model-name">' + (org ? '<span class="org">' + esc(org) + '/</span>' : '') + shortName(m.model) + '</div>' +
                     '<span class="status-badge ' + st + '">' + overallStatus + '</span>' +
                     '</div>' +
                     '<div class="model-scenarios">' + scenarios + '</div>' +
                     '<div class="model-footer">' +
                     '<span class="updated">Updated ' + updated + '</span>' +
-                    '</div>';
-                grid.appendChild(card);
+                    '</div></div>';
+            }
 
-                // Attach error tooltip handlers to failed scenario rows
-                card.querySelectorAll('.scenario-row.has-error').forEach(row => {
-                    row.addEventListener('mouseenter', showErrorTip);
-                    row.addEventListener('mouseleave', hideErrorTip);
-                });
-            });
+            // Parse all cards in one pass
+            modelGrid.innerHTML = html;
         }
 
         function renderFailures() {
-            const tbody = document.getElementById('failuresBody');
-            tbody.innerHTML = '';
+            failuresBody.innerHTML = '';
 
             if (!DATA.failures.length) {
-                tbody.innerHTML = '<tr><td colspan="5" class="no-failures">No recent failures - all tests passing!</td></tr>';
+                failuresBody.innerHTML = '<tr><td colspan="5" class="no-failures">No recent failures - all tests passing!</td></tr>';
                 return;
             }
 
-            DATA.failures.forEach((f, idx) => {
+            let html = '';
+            for (let idx = 0; idx < DATA.failures.length; idx++) {
+                const f = DATA.failures[idx];
                 const colabUrl = getColabUrl(f.model, f.scenario);
-                // Get first meaningful line of error for preview
-                const errorLines = (f.details || '').split('\\n').filter(l => l.trim());
-                const errorPreview = errorLines.length > 0 ? errorLines[errorLines.length - 1].substring(0, 80) : (f.error_category || f.status);
                 const hasDetails = f.details && f.details.length > 0;
 
-                const tr = document.createElement('tr');
-                tr.className = hasDetails ? 'expandable-row' : '';
-                tr.innerHTML =
-                    '<td>' + formatTime(f.timestamp) + '</td>' +
-                    '<td>' + f.model.split('/').pop() + '</td>' +
+                html += (hasDetails ? '<tr class="expandable-row" data-idx="' + idx + '" style="cursor: pointer">' : '<tr>') +
+                    '<td>' + (f.timestamp_display || f.timestamp) + '</td>' +
+                    '<td>' + shortName(f.model) + '</td>' +
                     '<td>' + f.scenario + '</td>' +
                     '<td><span class="error-summary">' +
-                        '<span class="error-category-tag">' + (f.error_category || 'ERROR') + '</span> ' +
-                        '<span class="error-preview">' + escapeHtml(errorPreview) + (errorPreview.length >= 80 ? '...' : '') + '</span>' +
+                        '<span class="error-category-tag">' + esc(f.error_category || 'ERROR') + '</span> ' +
+                        '<span class="error-preview">' + esc(f.error_preview) + '</span>' +
                         (hasDetails ? '<span class="expand-hint">▼</span>' : '') +
                     '</span></td>' +
-                    '<td><a href="' + colabUrl + '" target="_blank" class="colab-link">Reproduce →</a></td>';
-                tbody.appendChild(tr);
-
-                // Add expandable details row
-                if (hasDetails) {
-                    const detailsRow = document.createElement('tr');
-                    detailsRow.className = 'error-details-row';
-                    detailsRow.id = 'details-' + idx;
-                    detailsRow.style.display = 'none';
-                    detailsRow.innerHTML = '<td colspan="5"><pre class="error-full-details">' + escapeHtml(f.details) + '</pre></td>';
-                    tbody.appendChild(detailsRow);
-
-                    // Toggle details on click
-                    tr.style.cursor = 'pointer';
-                    tr.addEventListener('click', (e) => {
-                        if (e.target.tagName === 'A') return; // Don't toggle when clicking links
-                        const details = document.getElementById('details-' + idx);
-                        const isOpen = details.style.display !== 'none';
-                        details.style.display = isOpen ? 'none' : 'table-row';
-                        tr.querySelector('.expand-hint').textContent = isOpen ? '▼' : '▲';
-                    });
+                    '<td><a href="' + colabUrl + '" target="_blank" class="colab-link">Reproduce →</a></td></tr>';
+            }
+
+            // Parse all rows in one pass; details rows are added on first expand
+            failuresBody.innerHTML = html;
+        }
+
+        // One delegated click handler toggles the details of any failure row.
+        // Full error text only enters the DOM once a row is first expanded.
+        function setupFailureDetails() {
+            failuresBody.addEventListener('click', e => {
+                if (e.target.closest('a')) return; // Don't toggle when clicking links
+                const tr = e.target.closest('.expandable-row');
+                if (!tr) return;
+                const idx = tr.dataset.idx;
+                let details = document.getElementById('details-' + idx);
+                if (!details) {
+                    tr.insertAdjacentHTML('afterend',
+                        '<tr class="error-details-row" id="details-' + idx + '" style="display: none">' +
+                        '<td colspan="5"><pre class="error-full-details">' + esc(DATA.failures[idx].details) + '</pre></td></tr>');
+                    details = tr.nextElementSibling;
                 }
+                const isOpen = details.style.display !== 'none';
+                details.style.display = isOpen ? 'none' : 'table-row';
+                tr.querySelector('.expand-hint').textContent = isOpen ? '▼' : '▲';
             });
         }
 
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-
-        function formatTime(iso) {
-            const d = new Date(iso);
-            return d.toLocaleDateString('en-US', {timeZone: 'America/New_York'}) + ' ' +
-                   d.toLocaleTimeString('en-US', {timeZone: 'America/New_York', hour: '2-digit', minute: '2-digit'});
-        }
+        // Seconds between page generation and now, added to server-computed ages
+        const PAGE_AGE_S = Math.max(0, (Date.now() - Date.parse(DATA.generated)) / 1000);
 
-        function formatTimeAgo(iso) {
-            const mins = Math.floor((Date.now() - new Date(iso)) / 60000);
+        function formatAgo(seconds) {
+            const mins = Math.floor((seconds + PAGE_AGE_S) / 60);
             if (mins < 60) return mins + 'm ago';
             if (mins < 1440) return Math.floor(mins / 60) + 'h ago';
             return Math.floor(mins / 1440) + 'd ago';
         }
 
-        const tooltip = document.getElementById('tooltip');
-
         // Format hour range for segment tooltip
         function getSegmentTimeRange(segmentIdx) {
             const hoursPerSegment = 24 / granularity;
@@ -1378,140 +1604,131 @@ def _generate_html(data: Dict[str, Any]) -> str:
             return fmt(startHour) + '-' + fmt(endHour);
         }
 
-        function showSegmentTip(e) {
-            e.stopPropagation();
-            const date = e.target.dataset.date;
-            const segmentIdx = parseInt(e.target.dataset.segmentIdx);
-            const model = document.getElementById('modelSelect').value;
+        // Segment tooltip HTML by "model|granularity|date|segment". The data
+        // never changes after load, so entries stay valid across model and
+        // granularity switches.
+        const segmentTipCache = new Map();
+
+        // Per-model hour rows and escaped short names for the all-models tooltip
+        const MODEL_ROWS = DATA.models.map(hourRow);
+        const MODEL_SHORT_NAMES = DATA.models.map(shortName);
+
+        // One delegated listener pair for all calendar segments
+        function setupCalendarTips() {
+            calendarEl.addEventListener('mouseover', e => {
+                const seg = e.target.closest('.calendar-segment');
+                if (seg) showSegmentTip(e, seg);
+            });
+            calendarEl.addEventListener('mouseout', e => {
+                if (e.target.closest('.calendar-segment')) hideTip();
+            });
+        }
+
+        function showSegmentTip(e, seg) {
+            const key = modelSelect.value + '|' + granularity + '|' + seg.dataset.date + '|' + seg.dataset.segmentIdx;
+            let html = segmentTipCache.get(key);
+            if (html === undefined) {
+                html = buildSegmentTip(seg.dataset.date, parseInt(seg.dataset.segmentIdx));
+                segmentTipCache.set(key, html);
+            }
+
+            showTooltip(html, Math.min(e.clientX + 12, window.innerWidth - 300), e.clientY + 12, false);
+        }
+
+        function buildSegmentTip(date, segmentIdx) {
+            const model = modelSelect.value;
             const timeRange = getSegmentTimeRange(segmentIdx);
 
             let html = '<strong>' + date + '</strong> <span style="color:var(--text-muted)">' + timeRange + '</span>';
 
-            if (DATA.daily[date]) {
+            if (hasData(date)) {
+                const dateIdx = DATE_INDEX.get(date);
                 const hoursPerSegment = 24 / granularity;
                 const startHour = segmentIdx * hoursPerSegment;
                 const endHour = startHour + hoursPerSegment;
 
                 if (model === '__all__') {
-                    // Aggregate all models for this time segment
-                    const modelStatuses = {};
-                    Object.entries(DATA.daily[date]).forEach(([m, d]) => {
-                        if (d.hours) {
-                            for (let h = startHour; h < endHour; h++) {
-                                if (d.hours[h]) {
-                                    const shortName = m.split('/').pop();
-                                    if (!modelStatuses[shortName]) modelStatuses[shortName] = [];
-                                    modelStatuses[shortName].push(d.hours[h]);
-                                }
-                            }
+                    // Aggregate all models for this time segment; at most six are listed
+                    let shown = 0;
+                    for (let m = 0; m < NUM_MODELS; m++) {
+                        const worst = worstInHours(MODEL_ROWS[m], dateIdx, startHour, endHour);
+                        if (!worst) continue;
+                        if (shown === 6) {
+                            html += '<div class="tip-status">...</div>';
+                            break;
                         }
-                    });
-                    const entries = Object.entries(modelStatuses).slice(0, 6);
-                    if (entries.length === 0) {
-                        html += '<div class="tip-status">No tests in this period</div>';
-                    } else {
-                        entries.forEach(([m, statuses]) => {
-                            const worst = statuses.includes('FAILED') ? 'FAILED' :
-                                         statuses.includes('SLOW') ? 'SLOW' : 'OK';
-                            html += '<div class="tip-status">' + m + ': ' + worst + '</div>';
-                        });
-                        if (Object.keys(modelStatuses).length > 6) html += '<div class="tip-status">...</div>';
+                        html += '<div class="tip-status">' + MODEL_SHORT_NAMES[m] + ': ' + DATA.status_codes[worst] + '</div>';
+                        shown++;
                     }
+                    if (shown === 0) html += '<div class="tip-status">No tests in this period</div>';
                 } else {
-                    const d = DATA.daily[date][model];
-                    if (d && d.hours) {
-                        const hourStatuses = [];
-                        for (let h = startHour; h < endHour; h++) {
-                            if (d.hours[h]) hourStatuses.push(d.hours[h]);
-                        }
-                        if (hourStatuses.length === 0) {
-                            html += '<div class="tip-status">No tests in this period</div>';
-                        } else {
-                            const worst = hourStatuses.includes('FAILED') ? 'FAILED' :
-                                         hourStatuses.includes('SLOW') ? 'SLOW' : 'OK';
-                            html += '<div class="tip-status">Status: ' + worst + '</div>';
-                        }
-                    } else {
+                    const worst = worstInHours(hourRow(model), dateIdx, startHour, endHour);
+                    if (worst === 0) {
                         html += '<div class="tip-status">No tests in this period</div>';
+                    } else {
+                        html += '<div class="tip-status">Status: ' + DATA.status_codes[worst] + '</div>';
                     }
                 }
             } else {
                 html += '<div class="tip-status">No tests run</div>';
             }
-
-            tooltip.innerHTML = html;
-            tooltip.style.display = 'block';
-            tooltip.style.left = Math.min(e.clientX + 12, window.innerWidth - 300) + 'px';
-            tooltip.style.top = (e.clientY + 12) + 'px';
-        }
-
-        function showTip(e) {
-            const date = e.target.dataset.date;
-            const model = document.getElementById('modelSelect').value;
-            let html = '<strong>' + date + '</strong>';
-
-            if (DATA.daily[date]) {
-                if (model === '__all__') {
-                    const entries = Object.entries(DATA.daily[date]).slice(0, 6);
-                    entries.forEach(([m, d]) => {
-                        html += '<div class="tip-status">' + m.split('/').pop() + ': ' + d.status + '</div>';
-                    });
-                    if (Object.keys(DATA.daily[date]).length > 6) html += '<div class="tip-status">...</div>';
-                } else {
-                    const d = DATA.daily[date][model];
-                    if (d) {
-                        html += '<div class="tip-status">Status: ' + d.status + '</div>';
-                        if (d.scenarios) {
-                            Object.entries(d.scenarios).forEach(([k, v]) => {
-                                html += '<div class="tip-status">' + k + ': ' + v + '</div>';
-                            });
-                        }
-                    }
-                }
-            } else {
-                html += '<div class="tip-status">No tests run</div>';
-            }
-
-            tooltip.innerHTML = html;
-            tooltip.style.display = 'block';
-            tooltip.style.left = Math.min(e.clientX + 12, window.innerWidth - 300) + 'px';
-            tooltip.style.top = (e.clientY + 12) + 'px';
+            return html;
+        }
+
+        // Positions are computed from the event before anything is written,
+        // and all writes land together in the next frame, so a burst of
+        // mouseovers costs one style update instead of interleaved reflows
+        let tipFrame = 0;
+        function showTooltip(html, left, top, isError) {
+            cancelAnimationFrame(tipFrame);
+            tipFrame = requestAnimationFrame(() => {
+                tooltip.innerHTML = html;
+                tooltip.className = isError ? 'tooltip error-tooltip' : 'tooltip';
+                tooltip.style.cssText = 'display:block;left:' + left + 'px;top:' + top + 'px';
+            });
         }
 
         function hideTip() {
+            cancelAnimationFrame(tipFrame);
             tooltip.style.display = 'none';
-            tooltip.classList.remove('error-tooltip');
+            tooltip.className = 'tooltip';
+        }
+
+        // One delegated listener pair for the error rows of all model cards,
+        // so re-rendering the grid attaches no handlers. Moves between a
+        // row's own children are ignored.
+        function setupErrorTips() {
+            modelGrid.addEventListener('mouseover', e => {
+                const row = e.target.closest('.scenario-row.has-error');
+                if (row && !row.contains(e.relatedTarget)) showErrorTip(e, row);
+            });
+            modelGrid.addEventListener('mouseout', e => {
+                const row = e.target.closest('.scenario-row.has-error');
+                if (row && !row.contains(e.relatedTarget)) hideErrorTip(e);
+            });
         }
 
         // Show error details tooltip for failed scenarios
-        function showErrorTip(e) {
-            const row = e.currentTarget;
-            const category = row.dataset.errorCategory;
-            const details = row.dataset.errorDetails;
-            const model = row.dataset.model;
+        function showErrorTip(e, row) {
+            const m = DATA.current[row.dataset.idx];
             const scenario = row.dataset.scenario;
+            const model = m.model;
+            const category = m.scenarios[scenario].error_category || 'ERROR';
+            const details = m.scenarios[scenario].details;
 
             if (!details) return;
 
-            let html = '<strong>' + model.split('/').pop() + ' / ' + scenario + '</strong>';
-            html += '<div class="error-category">' + category + '</div>';
-            html += '<div class="error-pre">' + details + '</div>';
-
-            tooltip.innerHTML = html;
-            tooltip.classList.add('error-tooltip');
-            tooltip.style.display = 'block';
+            let html = '<strong>' + shortName(model) + ' / ' + scenario + '</strong>';
+            html += '<div class="error-category">' + esc(category) + '</div>';
+            html += '<div class="error-pre">' + esc(details) + '</div>';
 
-            // Position tooltip, accounting for its larger size
-            const rect = tooltip.getBoundingClientRect();
+            // Position tooltip, accounting for its larger size, within the viewport
             let left = e.clientX + 12;
             let top = e.clientY + 12;
-
-            // Keep within viewport
             if (left + 500 > window.innerWidth) left = window.innerWidth - 520;
             if (top + 300 > window.innerHeight) top = Math.max(10, e.clientY - 320);
 
-            tooltip.style.left = left + 'px';
-            tooltip.style.top = top + 'px';
+            showTooltip(html, left, top, true);
         }
 
         function hideErrorTip(e) {
@@ -1522,13 +1739,161 @@ def _generate_html(data: Dict[str, Any]) -> str:
         }
 
         // Hide tooltip when mouse leaves it
-        document.getElementById('tooltip').addEventListener('mouseleave', hideTip);
+        tooltip.addEventListener('mouseleave', hideTip);
+
+        document.addEventListener('DOMContentLoaded', initDashboard);
+""")
+JS_FILENAME = f"dashboard.{hashlib.blake2b(_DASHBOARD_JS.encode(), digest_size=8).hexdigest()}.js"
+
+
+def _write_assets(data_dir: Path) -> None:
+    """Write the current stylesheet and script (+ .gz) into data_dir and drop outdated ones."""
+    for filename, content, pattern in (
+        (CSS_FILENAME, _DASHBOARD_CSS, "dashboard.*.css*"),
+        (JS_FILENAME, _DASHBOARD_JS, "dashboard.*.js*"),
+    ):
+        path = data_dir / filename
+        # The name is a hash of the content, so existing files are current
+        if not (path.exists() and path.with_name(filename + ".gz").exists()):
+            _write_with_gzip(path, content.encode())
+        for old in data_dir.glob(pattern):
+            if old.name not in (filename, filename + ".gz"):
+                old.unlink()
+
+
+# Page template, built once at import. The dashboard data is inlined at the
+# $DATA placeholder so the page renders without a second request.
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>NDIF Monitor</title>
+    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🔬</text></svg>">
+    <link rel="stylesheet" href="data/$CSS_FILE">
+</head>
+<body>
+    <div class="stale-banner" id="staleBanner">
+        <strong>Warning:</strong> Monitor data is stale. The monitoring system may be down.
+        <span id="staleTime"></span>
+    </div>
+    <header>
+        <div class="container">
+            <div class="header-inner">
+                <div class="header-title">
+                    <h1>NDIF Monitor</h1>
+                    <p>End-to-end testing of <a href="https://nnsight.net" target="_blank">nnsight</a> + <a href="https://ndif.us" target="_blank">NDIF</a></p>
+                </div>
+                <div class="header-meta">
+                    <div>Updated: <span id="updated">-</span></div>
+                    <div>nnsight <span class="version" id="version">-</span></div>
+                    <div id="hostInfo"></div>
+                </div>
+            </div>
+        </div>
+    </header>
 
-        loadData();
+    <main class="container">
+        <div class="summary" id="summary">
+            <div class="stat"><span class="stat-value total" id="statTotal">-</span><span class="stat-label">Models</span></div>
+            <div class="stat"><span class="stat-value ok" id="statOk">-</span><span class="stat-label">OK</span></div>
+            <div class="stat"><span class="stat-value slow" id="statSlow">-</span><span class="stat-label">Slow</span></div>
+            <div class="stat"><span class="stat-value failed" id="statFailed">-</span><span class="stat-label">Failed</span></div>
+        </div>
+
+        <section>
+            <div class="section-header">
+                <h2>Status History</h2>
+                <div style="display:flex;gap:1rem;align-items:center;flex-wrap:wrap">
+                    <div class="legend">
+                        <div class="legend-item"><div class="legend-dot ok"></div>OK</div>
+                        <div class="legend-item"><div class="legend-dot slow"></div>Slow</div>
+                        <div class="legend-item"><div class="legend-dot failed"></div>Failed</div>
+                        <div class="legend-item"><div class="legend-dot cold"></div>Cold</div>
+                        <div class="legend-item"><div class="legend-dot empty"></div>No data</div>
+                    </div>
+                    <div class="model-filter">
+                        <select id="modelSelect">
+                            <option value="__all__">All models</option>
+                        </select>
+                    </div>
+                </div>
+            </div>
+            <div class="calendar-wrapper">
+                <div class="calendar-container">
+                    <div class="calendar-months" id="calendarMonths"></div>
+                    <div class="calendar" id="calendar"></div>
+                </div>
+            </div>
+            <div class="calendar-resize" id="calendarResize">
+                <div class="resize-handle"></div>
+                <span class="resize-label" id="resizeLabel">6h segments</span>
+            </div>
+        </section>
+
+        <section>
+            <div class="section-header">
+                <h2>Current Status</h2>
+            </div>
+            <div class="model-grid" id="modelGrid"></div>
+        </section>
+
+        <section>
+            <div class="section-header">
+                <h2>Recent Failures</h2>
+            </div>
+            <table class="failures-table">
+                <thead>
+                    <tr>
+                        <th>Time</th>
+                        <th>Model</th>
+                        <th>Test</th>
+                        <th>Error</th>
+                        <th></th>
+                    </tr>
+                </thead>
+                <tbody id="failuresBody"></tbody>
+            </table>
+        </section>
+    </main>
+
+    <footer>
+        <div class="container">
+            <a href="https://github.com/davidbau/ndif-monitor" target="_blank">GitHub</a> ·
+            <a href="https://nnsight.net/documentation" target="_blank">nnsight docs</a> ·
+            <a href="https://ndif.us" target="_blank">NDIF</a>
+        </div>
+    </footer>
+
+    <div class="tooltip" id="tooltip" style="display:none"></div>
+
+    <script>
+        // Dashboard data, inlined when the page is generated
+        const DATA = $DATA;
     </script>
+    <script src="data/$JS_FILE"></script>
 </body>
-</html>"""
-    return html
+</html>""")
+
+
+# Everything but the data is fixed at import, so the page is assembled by
+# concatenation instead of scanning the whole template on every build. The
+# pieces are pre-encoded so the serialized data never round-trips through str.
+_HTML_HEAD, _HTML_TAIL = (
+    piece.encode()
+    for piece in _strip_indentation(
+        _HTML_TEMPLATE.safe_substitute(CSS_FILE=CSS_FILENAME, JS_FILE=JS_FILENAME)
+    ).split("$DATA")
+)
+
+
+def _generate_html(data_json: bytes) -> bytes:
+    """Generate the encoded HTML page with the (serialized) dashboard data inlined."""
+    # Keep "</script>" (e.g. in error details) from closing the data block
+    data_json = data_json.replace(b"<", b"\\u003c")
+    # Add any further page pieces to this list rather than growing a string
+    parts = [_HTML_HEAD, data_json, _HTML_TAIL]
+    return b"".join(parts)
 
 
 def generate_dashboard(
@@ -1551,7 +1916,7 @@ def generate_dashboard(
     results_path = Path(results_dir)
     history = HistoryStore(results_path / "history.jsonl")
 
-    html = generate_dashboard_html(
+    page = _build_dashboard_page(
         history=history,
         results_dir=results_path,
         days=days,
@@ -1559,7 +1924,6 @@ def generate_dashboard(
     )
 
     output_path = results_path / output_file
-    with open(output_path, "w") as f:
-        f.write(html)
+    _write_with_gzip(output_path, page)
 
     return str(output_path)
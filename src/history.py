@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import json
@@ -51,23 +52,32 @@ def utc_to_eastern_hour(timestamp: str) -> str:
     Returns:
         String in format "YYYY-MM-DD-HH" where HH is hour 0-23
     """
-    ts = timestamp.rstrip('Z')
+    # Eastern is a whole number of hours from UTC, so only the UTC date and
+    # hour matter; history holds many entries per hour
+    return _utc_hour_to_eastern_hour(timestamp.rstrip('Z')[:13])
+
+
+@lru_cache(maxsize=16384)
+def _utc_hour_to_eastern_hour(utc_hour: str) -> str:
+    """Convert a UTC "YYYY-MM-DDTHH" prefix to Eastern "YYYY-MM-DD-HH"."""
     try:
-        dt = datetime.fromisoformat(ts).replace(tzinfo=timezone.utc)
+        dt = datetime.fromisoformat(utc_hour).replace(tzinfo=timezone.utc)
     except ValueError:
-        return timestamp[:10] + "-0"
+        return utc_hour[:10] + "-0"
 
     eastern_dt = dt.astimezone(EASTERN)
     return eastern_dt.strftime("%Y-%m-%d") + f"-{eastern_dt.hour}"
 
 
+@lru_cache(maxsize=1)
 def get_hostname() -> str:
-    """Get short hostname of current machine."""
+    """Get short hostname of current machine (looked up once per process)."""
     return socket.gethostname().split('.')[0]
 
 
+@lru_cache(maxsize=1)
 def get_username() -> str:
-    """Get current username."""
+    """Get current username (looked up once per process)."""
     return getpass.getuser()
 
 
@@ -122,6 +132,11 @@ class HistoryEntry:
         )
 
 
+# Start of every line written by HistoryEntry.to_json_line; the timestamp
+# value follows it, up to the next quote
+_TS_PREFIX = '{"ts":"'
+
+
 class HistoryStore:
     """Append-only history storage using JSONL format."""
 
@@ -145,6 +160,7 @@ class HistoryStore:
         days: int = 365,
         model: Optional[str] = None,
         scenario: Optional[str] = None,
+        since: Optional[str] = None,
     ) -> List[HistoryEntry]:
         """Load history entries, optionally filtered.
 
@@ -152,6 +168,7 @@ class HistoryStore:
             days: Only load entries from last N days
             model: Filter by model name
             scenario: Filter by scenario name
+            since: Only load entries at or after this UTC ISO timestamp
 
         Returns:
             List of HistoryEntry objects
@@ -161,13 +178,20 @@ class HistoryStore:
 
         cutoff = datetime.utcnow() - timedelta(days=days)
         cutoff_str = cutoff.isoformat()
+        if since and since > cutoff_str:
+            cutoff_str = since
 
         entries = []
+        n = len(_TS_PREFIX)
         with open(self.history_file, "r") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
+                # Lines written by to_json_line start with the timestamp, so
+                # entries before the cutoff are skipped without parsing JSON
+                if line.startswith(_TS_PREFIX) and line[n:line.find('"', n)] < cutoff_str:
+                    continue
                 try:
                     entry = HistoryEntry.from_json_line(line)
                     # Filter by date
@@ -227,63 +251,29 @@ class HistoryStore:
         Returns:
             Dict mapping date -> model -> {status, scenarios}
         """
-        entries = self.load(days=days)
+        return _summarize_daily(self.load(days=days))
+
+    def get_daily_summary_since(
+        self,
+        since_date: str,
+        days: int = 365,
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get the daily summary for Eastern dates on or after since_date.
+
+        Only entries from since_date onwards are grouped, so callers holding
+        earlier (complete, no longer changing) days can splice this onto them.
+
+        Args:
+            since_date: First Eastern date to include (YYYY-MM-DD)
+            days: Only consider entries from last N days
 
-        # Group by date and model
-        daily: Dict[str, Dict[str, Dict[str, str]]] = {}
-
-        for entry in entries:
-            # Extract date and hour from timestamp, converting to Eastern timezone
-            hour_key = utc_to_eastern_hour(entry.timestamp)
-            date = hour_key[:10]  # YYYY-MM-DD portion
-
-            if date not in daily:
-                daily[date] = {}
-            if entry.model not in daily[date]:
-                daily[date][entry.model] = {"scenarios": {}, "hours": {}}
-
-            daily[date][entry.model]["scenarios"][entry.scenario] = entry.status
-
-            # Track hourly status (0-23)
-            hour = hour_key.split("-")[-1]  # "0" through "23"
-            if hour not in daily[date][entry.model]["hours"]:
-                daily[date][entry.model]["hours"][hour] = []
-            daily[date][entry.model]["hours"][hour].append(entry.status)
-
-        # Helper to compute worst status from a list of statuses
-        def worst_status(statuses: List[str]) -> str:
-            if "UNAVAILABLE" in statuses:
-                return "UNAVAILABLE"
-            if "FAILED" in statuses:
-                return "FAILED"
-            if "DEGRADED" in statuses:
-                return "DEGRADED"
-            if "SLOW" in statuses:
-                return "SLOW"
-            if statuses and all(s == "COLD" for s in statuses):
-                return "COLD"
-            return "OK" if statuses else None
-
-        # Convert to summary format
-        summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        for date, models in daily.items():
-            summary[date] = {}
-            for model, model_data in models.items():
-                scenario_statuses = list(model_data["scenarios"].values())
-                overall = worst_status(scenario_statuses)
-
-                # Compute per-hour status (0-23)
-                hours_summary = {}
-                for hour_num, hour_statuses in model_data["hours"].items():
-                    hours_summary[hour_num] = worst_status(hour_statuses)
-
-                summary[date][model] = {
-                    "status": overall,
-                    "scenarios": model_data["scenarios"],
-                    "hours": hours_summary,
-                }
-
-        return summary
+        Returns:
+            Dict mapping date -> model -> {status, scenarios}
+        """
+        start = datetime.fromisoformat(since_date).replace(tzinfo=EASTERN)
+        since = start.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+        summary = _summarize_daily(self.load(days=days, since=since))
+        return {date: data for date, data in summary.items() if date >= since_date}
 
     def get_recent_failures(
         self,
@@ -301,6 +291,65 @@ class HistoryStore:
         return failures[:limit]
 
 
+def _summarize_daily(entries: List[HistoryEntry]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Group entries into date -> model -> {status, scenarios, hours}."""
+    # Group by date and model
+    daily: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    for entry in entries:
+        # Extract date and hour from timestamp, converting to Eastern timezone
+        hour_key = utc_to_eastern_hour(entry.timestamp)
+        date = hour_key[:10]  # YYYY-MM-DD portion
+
+        if date not in daily:
+            daily[date] = {}
+        if entry.model not in daily[date]:
+            daily[date][entry.model] = {"scenarios": {}, "hours": {}}
+
+        daily[date][entry.model]["scenarios"][entry.scenario] = entry.status
+
+        # Track hourly status (0-23)
+        hour = hour_key.split("-")[-1]  # "0" through "23"
+        if hour not in daily[date][entry.model]["hours"]:
+            daily[date][entry.model]["hours"][hour] = []
+        daily[date][entry.model]["hours"][hour].append(entry.status)
+
+    # Helper to compute worst status from a list of statuses
+    def worst_status(statuses: List[str]) -> str:
+        if "UNAVAILABLE" in statuses:
+            return "UNAVAILABLE"
+        if "FAILED" in statuses:
+            return "FAILED"
+        if "DEGRADED" in statuses:
+            return "DEGRADED"
+        if "SLOW" in statuses:
+            return "SLOW"
+        if statuses and all(s == "COLD" for s in statuses):
+            return "COLD"
+        return "OK" if statuses else None
+
+    # Convert to summary format
+    summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for date, models in daily.items():
+        summary[date] = {}
+        for model, model_data in models.items():
+            scenario_statuses = list(model_data["scenarios"].values())
+            overall = worst_status(scenario_statuses)
+
+            # Compute per-hour status (0-23)
+            hours_summary = {}
+            for hour_num, hour_statuses in model_data["hours"].items():
+                hours_summary[hour_num] = worst_status(hour_statuses)
+
+            summary[date][model] = {
+                "status": overall,
+                "scenarios": model_data["scenarios"],
+                "hours": hours_summary,
+            }
+
+    return summary
+
+
 def estimate_storage(days: int = 365, models: int = 9, scenarios: int = 3) -> str:
     """Estimate storage requirements for history.
 
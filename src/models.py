@@ -1,14 +1,20 @@
 """NDIF status API and model registry for NDIF Monitor."""
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Dict, Optional, Any
 from enum import Enum
 import requests
 import json
+import os
+import time
 
 
 NDIF_STATUS_URL = "https://api.ndif.us/status"
 
+# Seconds a status response cached on disk is reused before refetching
+STATUS_CACHE_TTL = 45
+
 
 # Baseline models that are typically always hot and should always be tested.
 # These represent core architectures that NDIF keeps running as dedicated deployments.
@@ -120,13 +126,53 @@ def detect_architecture(model_key: str, config_str: Optional[str] = None) -> Mod
     return ModelArchitecture.UNKNOWN
 
 
-def fetch_ndif_status() -> Dict[str, Any]:
-    """Fetch current NDIF deployment status."""
+def fetch_ndif_status(
+    cache_dir: Optional[Path] = None,
+    ttl: int = STATUS_CACHE_TTL,
+) -> Dict[str, Any]:
+    """Fetch current NDIF deployment status.
+
+    Args:
+        cache_dir: If set, reuse a response cached in this directory while it
+            is younger than `ttl` seconds
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        Parsed status JSON
+    """
+    if cache_dir is None:
+        return _request_ndif_status()
+    return _fetch_ndif_status_cached(Path(cache_dir), ttl)
+
+
+def _request_ndif_status() -> Dict[str, Any]:
+    """Fetch status from the NDIF API, bypassing all caches."""
     response = requests.get(NDIF_STATUS_URL, timeout=30)
     response.raise_for_status()
     return response.json()
 
 
+def _fetch_ndif_status_cached(cache_dir: Path, ttl: int) -> Dict[str, Any]:
+    """Fetch status through the on-disk cache; each call returns a fresh dict."""
+    cache_path = cache_dir / "ndif_status.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            with open(cache_path, "r") as f:
+                return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass  # Missing or corrupt cache, fetch fresh
+
+    status = _request_ndif_status()
+
+    # Write to a temp file and rename so concurrent runs never see a partial file
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(status, f)
+    os.replace(tmp_path, cache_path)
+    return status
+
+
 def get_available_models(
     status: Optional[Dict[str, Any]] = None,
     hot_only: bool = True,
@@ -238,6 +284,7 @@ def get_test_models(
     status: Optional[Dict[str, Any]] = None,
     include_extra_hot: bool = True,
     max_extra_per_architecture: int = 1,
+    all_models: Optional[List[ModelInfo]] = None,
 ) -> List[ModelInfo]:
     """Get models to test: baseline models + optionally extra hot models.
 
@@ -245,15 +292,17 @@ def get_test_models(
         status: Pre-fetched status dict, or None to fetch fresh
         include_extra_hot: Whether to include additional hot models beyond baseline
         max_extra_per_architecture: Max extra models per architecture
+        all_models: Already parsed get_available_models(hot_only=False)
+            result; status is not used when given
 
     Returns:
         List of models to test
     """
-    if status is None:
-        status = fetch_ndif_status()
-
-    all_models = get_available_models(status, hot_only=False)
-    hot_models = get_available_models(status, hot_only=True)
+    if all_models is None:
+        if status is None:
+            status = fetch_ndif_status()
+        all_models = get_available_models(status, hot_only=False)
+    hot_models = [m for m in all_models if m.deployment_level == DeploymentLevel.HOT]
 
     # Start with baseline models
     baseline = get_baseline_models(all_models)
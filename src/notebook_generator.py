@@ -8,6 +8,7 @@ Creates model-specific notebooks that can be loaded directly in Colab with:
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -62,23 +63,7 @@ def generate_colab_notebook(
     ]))
 
     # Install dependencies and configure auth
-    cells.append(make_cell("code", [
-        "# Install dependencies\n",
-        "!pip install -q nnsight torch\n",
-        "\n",
-        "# Load API keys from Colab secrets into environment\n",
-        "# nnsight automatically picks up NDIF_API_KEY from env\n",
-        "import os\n",
-        "try:\n",
-        "    from google.colab import userdata\n",
-        "    for key in ['NDIF_API_KEY', 'HF_TOKEN']:\n",
-        "        try:\n",
-        "            os.environ[key] = userdata.get(key)\n",
-        "        except:\n",
-        "            pass\n",
-        "except ImportError:\n",
-        "    pass  # Not in Colab, use existing env vars\n",
-    ]))
+    cells.append(_INSTALL_CELL)
 
     # Model loading - hardcoded model name
     cells.append(make_cell("code", [
@@ -96,32 +81,10 @@ def generate_colab_notebook(
     ]))
 
     # Scenario-specific test code
-    if scenario == "basic_trace":
-        cells.append(make_cell("markdown", [
-            "## Basic Trace Test\n",
-            "\n",
-            "Tests `model.trace()` functionality with hidden state extraction.\n",
-        ]))
-        cells.append(make_cell("code", _generate_trace_code(model_name)))
-        cells.append(make_cell("code", _generate_validation_code("basic_trace")))
-
-    elif scenario == "generation":
-        cells.append(make_cell("markdown", [
-            "## Generation Test\n",
-            "\n",
-            "Tests `model.generate()` functionality.\n",
-        ]))
-        cells.append(make_cell("code", _generate_generation_code(model_name)))
-        cells.append(make_cell("code", _generate_validation_code("generation")))
-
-    elif scenario == "hidden_states":
-        cells.append(make_cell("markdown", [
-            "## Hidden States Extraction\n",
-            "\n",
-            "Tests extracting hidden states from all layers.\n",
-        ]))
-        cells.append(make_cell("code", _generate_hidden_states_code(model_name)))
-        cells.append(make_cell("code", _generate_validation_code("hidden_states")))
+    if scenario in _SCENARIO_CODE:
+        cells.append(_SCENARIO_INTRO_CELLS[scenario])
+        cells.append(_scenario_code_cell(scenario, _get_layer_accessor(model_name)))
+        cells.append(_VALIDATION_CELLS[scenario])
 
     # Success cell
     scenario_display = scenario.upper().replace("_", " ")
@@ -163,9 +126,8 @@ def _get_layer_accessor(model_name: str) -> str:
         return "model.model.layers"
 
 
-def _generate_trace_code(model_name: str) -> List[str]:
-    """Generate trace test code for a specific model."""
-    layer_accessor = _get_layer_accessor(model_name)
+def _generate_trace_code(layer_accessor: str) -> List[str]:
+    """Generate trace test code for a model's layer accessor."""
     return [
         "# Run basic trace\n",
         "prompt = 'The quick brown fox jumps over the lazy dog'\n",
@@ -181,7 +143,7 @@ def _generate_trace_code(model_name: str) -> List[str]:
     ]
 
 
-def _generate_generation_code(model_name: str) -> List[str]:
+def _generate_generation_code() -> List[str]:
     """Generate text generation test code."""
     return [
         "# Run generation\n",
@@ -201,12 +163,11 @@ def _generate_generation_code(model_name: str) -> List[str]:
     ]
 
 
-def _generate_hidden_states_code(model_name: str) -> List[str]:
+def _generate_hidden_states_code(layer_accessor: str) -> List[str]:
     """Generate hidden states extraction code.
 
     Uses list.save() - nnsight 0.5 adds .save() method to built-in types.
     """
-    layer_accessor = _get_layer_accessor(model_name)
     return [
         "# Extract hidden states from all layers\n",
         "prompt = 'Hello world'\n",
@@ -233,58 +194,121 @@ def _generate_hidden_states_code(model_name: str) -> List[str]:
     ]
 
 
-def _generate_validation_code(scenario: str) -> List[str]:
-    """Generate validation code for a scenario."""
-    if scenario == "basic_trace":
-        return [
-            "# Validate results\n",
-            "import torch\n",
-            "\n",
-            "if 'hidden' not in dir():\n",
-            "    raise RuntimeError('Trace was interrupted - hidden state not captured. Try running again.')\n",
-            "\n",
-            "# Verify shape is reasonable\n",
-            "assert len(hidden.shape) >= 2, f'Expected at least 2D tensor, got {hidden.shape}'\n",
-            "assert hidden.shape[-1] > 0, 'Hidden dimension should be positive'\n",
-            "\n",
-            "# Check for NaN/Inf\n",
-            "assert not torch.isnan(hidden).any(), 'Hidden state contains NaN values'\n",
-            "assert not torch.isinf(hidden).any(), 'Hidden state contains Inf values'\n",
-            "\n",
-            "print('Validation ' + 'passed!')\n",
-        ]
-    elif scenario == "generation":
-        return [
-            "# Validate generation\n",
-            "if 'generated_text' not in dir():\n",
-            "    raise RuntimeError('Generation was interrupted - output not captured. Try running again.')\n",
-            "\n",
-            "assert len(generated_text) > len(prompt), 'No text was generated'\n",
-            "assert generated_text.startswith(prompt[:20]), 'Generated text does not start with prompt'\n",
-            "\n",
-            "print('Validation ' + 'passed!')\n",
-        ]
-    elif scenario == "hidden_states":
-        return [
-            "# Validate hidden states\n",
-            "import torch\n",
-            "\n",
-            "assert len(states) == num_layers, f'Expected {num_layers} states, got {len(states)}'\n",
-            "\n",
-            "for i, state in enumerate(states):\n",
-            "    assert not torch.isnan(state).any(), f'Layer {i} contains NaN'\n",
-            "    assert not torch.isinf(state).any(), f'Layer {i} contains Inf'\n",
-            "\n",
-            "print('Validation ' + 'passed!')\n",
-        ]
-    return []
+# Validation code per scenario, run after the test cell
+_VALIDATION_CODE: Dict[str, List[str]] = {
+    "basic_trace": [
+        "# Validate results\n",
+        "import torch\n",
+        "\n",
+        "if 'hidden' not in dir():\n",
+        "    raise RuntimeError('Trace was interrupted - hidden state not captured. Try running again.')\n",
+        "\n",
+        "# Verify shape is reasonable\n",
+        "assert len(hidden.shape) >= 2, f'Expected at least 2D tensor, got {hidden.shape}'\n",
+        "assert hidden.shape[-1] > 0, 'Hidden dimension should be positive'\n",
+        "\n",
+        "# Check for NaN/Inf\n",
+        "assert not torch.isnan(hidden).any(), 'Hidden state contains NaN values'\n",
+        "assert not torch.isinf(hidden).any(), 'Hidden state contains Inf values'\n",
+        "\n",
+        "print('Validation ' + 'passed!')\n",
+    ],
+    "generation": [
+        "# Validate generation\n",
+        "if 'generated_text' not in dir():\n",
+        "    raise RuntimeError('Generation was interrupted - output not captured. Try running again.')\n",
+        "\n",
+        "assert len(generated_text) > len(prompt), 'No text was generated'\n",
+        "assert generated_text.startswith(prompt[:20]), 'Generated text does not start with prompt'\n",
+        "\n",
+        "print('Validation ' + 'passed!')\n",
+    ],
+    "hidden_states": [
+        "# Validate hidden states\n",
+        "import torch\n",
+        "\n",
+        "assert len(states) == num_layers, f'Expected {num_layers} states, got {len(states)}'\n",
+        "\n",
+        "for i, state in enumerate(states):\n",
+        "    assert not torch.isnan(state).any(), f'Layer {i} contains NaN'\n",
+        "    assert not torch.isinf(state).any(), f'Layer {i} contains Inf'\n",
+        "\n",
+        "print('Validation ' + 'passed!')\n",
+    ],
+}
+
+
+# Cells that do not depend on the model are built once at import and shared
+# by every notebook; notebooks are serialized right after generation.
+_INSTALL_CELL = make_cell("code", [
+    "# Install dependencies\n",
+    "!pip install -q nnsight torch\n",
+    "\n",
+    "# Load API keys from Colab secrets into environment\n",
+    "# nnsight automatically picks up NDIF_API_KEY from env\n",
+    "import os\n",
+    "try:\n",
+    "    from google.colab import userdata\n",
+    "    for key in ['NDIF_API_KEY', 'HF_TOKEN']:\n",
+    "        try:\n",
+    "            os.environ[key] = userdata.get(key)\n",
+    "        except:\n",
+    "            pass\n",
+    "except ImportError:\n",
+    "    pass  # Not in Colab, use existing env vars\n",
+])
+
+_SCENARIO_INTRO_CELLS = {
+    "basic_trace": make_cell("markdown", [
+        "## Basic Trace Test\n",
+        "\n",
+        "Tests `model.trace()` functionality with hidden state extraction.\n",
+    ]),
+    "generation": make_cell("markdown", [
+        "## Generation Test\n",
+        "\n",
+        "Tests `model.generate()` functionality.\n",
+    ]),
+    "hidden_states": make_cell("markdown", [
+        "## Hidden States Extraction\n",
+        "\n",
+        "Tests extracting hidden states from all layers.\n",
+    ]),
+}
+
+# Test code generator per scenario, given the model's layer accessor
+_SCENARIO_CODE = {
+    "basic_trace": _generate_trace_code,
+    "generation": lambda _layer_accessor: _generate_generation_code(),  # Same for every model
+    "hidden_states": _generate_hidden_states_code,
+}
+
+
+@lru_cache(maxsize=None)
+def _scenario_code_cell(scenario: str, layer_accessor: str) -> Dict[str, Any]:
+    """Test code cell for a scenario, shared by models with the same layer accessor."""
+    return make_cell("code", _SCENARIO_CODE[scenario](layer_accessor))
+
+
+_VALIDATION_CELLS = {
+    scenario: make_cell("code", code) for scenario, code in _VALIDATION_CODE.items()
+}
 
 
 def save_notebook(notebook: Dict[str, Any], path: Path) -> None:
-    """Save notebook to file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(notebook, f, indent=1)
+    """Save notebook to file, leaving it untouched if the content is unchanged.
+
+    Notebooks are regenerated on every run; keeping the mtime of unchanged
+    files lets deploys skip them by size + mtime.
+    """
+    # Encode in memory and write once; json.dump issues a write per token
+    payload = json.dumps(notebook, indent=1).encode()
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
 
 
 def generate_colab_notebooks_for_model(
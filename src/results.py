@@ -6,8 +6,27 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pathlib import Path
 import json
+import os
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: stdlib json is used instead
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_indented(data: Dict[str, Any]) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON (orjson when available).
+
+    Non-ASCII text is written as UTF-8 rather than \\u escapes in both
+    paths, since orjson cannot escape it.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
 
 class Status(Enum):
     """Test result status levels."""
@@ -144,16 +163,16 @@ class ModelStatus:
 
     def save(self, path: str) -> None:
         """Save to JSON file."""
-        with open(path, "w") as f:
-            f.write(self.to_json())
+        Path(path).write_bytes(_dumps_indented(self.to_dict()))
 
     @classmethod
     def load(cls, path: str) -> Optional["ModelStatus"]:
         """Load from JSON file, returns None if file doesn't exist."""
-        if not Path(path).exists():
+        try:
+            with open(path, "rb") as f:
+                return cls.from_dict(_json_loads(f.read()))
+        except FileNotFoundError:
             return None
-        with open(path, "r") as f:
-            return cls.from_dict(json.load(f))
 
 
 @dataclass
@@ -214,8 +233,14 @@ class MonitorRun:
 
     def save(self, path: str) -> None:
         """Save results to JSON file."""
-        with open(path, "w") as f:
-            f.write(self.to_json())
+        Path(path).write_bytes(_dumps_indented(self.to_dict()))
+
+    def append_to_log(self, path: str) -> None:
+        """Append results as one JSON line to a JSONL run log."""
+        with open(path, "a") as f:
+            f.write(json.dumps(self.to_dict(), separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
 
 def classify_error(error_text: str) -> ErrorCategory:
@@ -269,6 +294,43 @@ def model_to_filename(model_name: str) -> str:
     return f"{safe}.json"
 
 
+# Status files are tiny; loading is dominated by open/read latency
+STATUS_LOAD_WORKERS = 16
+
+# JSON files in a results directory that are not per-model status files:
+# hidden state files, run logs and the legacy dashboard data file
+_NON_STATUS_PREFIXES = (".", "run_")
+_NON_STATUS_NAMES = frozenset({"dashboard_data.json"})
+
+
+def list_model_status_paths(results_dir: Path) -> List[str]:
+    """List per-model status files in a results directory.
+
+    Skips hidden files, run logs and the legacy dashboard data file. Uses a
+    single os.scandir pass and plain name checks (no glob, no per-file stat).
+    """
+    return [entry.path for entry in scan_model_status_files(results_dir)]
+
+
+def scan_model_status_files(results_dir: Path) -> List[os.DirEntry]:
+    """Like list_model_status_paths, but return the os.DirEntry objects.
+
+    Callers that also need names or stat results can take them from the
+    entries (entry.stat() reuses any stat the type check already made).
+    """
+    try:
+        with os.scandir(results_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(_NON_STATUS_PREFIXES)
+                and entry.name not in _NON_STATUS_NAMES
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def filename_to_model(filename: str) -> str:
     """Convert filename back to model name."""
     name = filename.replace(".json", "")
@@ -3,13 +3,16 @@
 import os
 import time
 import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 
 from .models import (
     ModelInfo,
+    DeploymentLevel,
     get_available_models,
     get_test_models,
     select_test_models,
@@ -18,11 +21,13 @@ from .models import (
     BASELINE_MODELS,
 )
 from .results import (
+    STATUS_LOAD_WORKERS,
     MonitorRun,
     TestResult,
     Status,
     ModelStatus,
     ScenarioResult,
+    list_model_status_paths,
     model_to_filename,
 )
 from .jupyter_executor import VenvManager, run_notebook_test
@@ -41,6 +46,10 @@ class Scenario:
     architectures: List[str] = field(default_factory=list)  # If model_specific
 
 
+# Append-only log of run summaries, one JSON line per run
+RUN_LOG_FILE = "run_log.jsonl"
+
+
 # Default test scenarios - notebooks are in notebooks/colab/{model}/{scenario}.ipynb
 DEFAULT_SCENARIOS = [
     Scenario(
@@ -98,6 +107,7 @@ class MonitorRunner:
         notebooks_dir: str,
         results_dir: str,
         scenarios: Optional[List[Scenario]] = None,
+        use_status_cache: bool = True,
     ):
         """Initialize monitor runner.
 
@@ -105,10 +115,12 @@ class MonitorRunner:
             notebooks_dir: Directory containing test notebooks
             results_dir: Directory for storing results JSON files
             scenarios: List of scenarios to run (uses defaults if None)
+            use_status_cache: Reuse a recently fetched NDIF status from results_dir/.cache
         """
         self.notebooks_dir = Path(notebooks_dir)
         self.results_dir = Path(results_dir)
         self.scenarios = scenarios or DEFAULT_SCENARIOS
+        self.status_cache_dir = self.results_dir / ".cache" if use_status_cache else None
 
         # Ensure directories exist
         self.notebooks_dir.mkdir(parents=True, exist_ok=True)
@@ -234,6 +246,62 @@ class MonitorRunner:
 
         return status
 
+    def run_scenario(
+        self,
+        model: ModelInfo,
+        scenario: Scenario,
+        venv: VenvManager,
+        env_vars: Optional[Dict[str, str]] = None,
+        notebook_path: Optional[Path] = None,
+    ) -> TestResult:
+        """Execute one scenario notebook for a model (no status bookkeeping).
+
+        Pass notebook_path when it comes from ensure_notebooks_generated(),
+        which has just written it, to skip re-resolving and stat-ing it.
+        """
+        if notebook_path is None:
+            notebook_path = self.get_notebook_path(model.model_key, scenario)
+            exists = notebook_path.exists()
+        else:
+            exists = True
+        if not exists:
+            print(f"⚠ notebook not found")
+            return TestResult(
+                model=model.model_key,
+                scenario=scenario.name,
+                status=Status.FAILED,
+                duration_ms=0,
+                details=f"Notebook not found: {notebook_path.name}",
+            )
+
+        # Run the Colab notebook (has hardcoded model name, no MODEL_NAME env var needed)
+        return run_notebook_test(
+            notebook_path=str(notebook_path),
+            model_name=model.model_key,
+            scenario_name=scenario.name,
+            venv=venv,
+            timeout=scenario.timeout,
+            extra_env=env_vars,
+        )
+
+    def print_result(self, result: TestResult) -> None:
+        """Print a one-line result symbol, status and duration."""
+        status_symbols = {
+            Status.OK: "✓",
+            Status.SLOW: "~",
+            Status.DEGRADED: "⚠",
+            Status.FAILED: "✗",
+            Status.UNAVAILABLE: "·",
+            Status.COLD: "○",
+        }
+        symbol = status_symbols.get(result.status, "?")
+        duration_str = f"{result.duration_ms / 1000:.1f}s"
+        print(f"{symbol} {result.status.value} ({duration_str})")
+        if result.details and result.status == Status.FAILED:
+            # Print first line of error
+            first_line = result.details.split('\n')[0][:60]
+            print(f"    {first_line}...")
+
     def run_single_model(
         self,
         model: ModelInfo,
@@ -268,7 +336,7 @@ class MonitorRunner:
             return results
 
         # Generate Colab notebooks for this model (they have hardcoded model names)
-        self.ensure_notebooks_generated(model.model_key)
+        notebook_files = {p.stem: p for p in self.ensure_notebooks_generated(model.model_key)}
 
         for scenario in self.scenarios:
             # Skip if model_specific and architecture doesn't match
@@ -278,27 +346,9 @@ class MonitorRunner:
 
             print(f"\n  {scenario.name}...", end=" ", flush=True)
 
-            notebook_path = self.get_notebook_path(model.model_key, scenario)
-            if not notebook_path.exists():
-                print(f"⚠ notebook not found")
-                result = TestResult(
-                    model=model.model_key,
-                    scenario=scenario.name,
-                    status=Status.FAILED,
-                    duration_ms=0,
-                    details=f"Notebook not found: {notebook_path.name}",
-                )
-            else:
-                # Run the Colab notebook (has hardcoded model name, no MODEL_NAME env var needed)
-                result = run_notebook_test(
-                    notebook_path=str(notebook_path),
-                    model_name=model.model_key,
-                    scenario_name=scenario.name,
-                    venv=venv,
-                    timeout=scenario.timeout,
-                    extra_env=env_vars,
-                )
-
+            result = self.run_scenario(
+                model, scenario, venv, env_vars, notebook_files.get(scenario.name)
+            )
             results.append(result)
 
             # Update per-model status file immediately
@@ -309,31 +359,87 @@ class MonitorRunner:
                 nnsight_version,
             )
 
-            # Print result
-            status_symbols = {
-                Status.OK: "✓",
-                Status.SLOW: "~",
-                Status.DEGRADED: "⚠",
-                Status.FAILED: "✗",
-                Status.UNAVAILABLE: "·",
-                Status.COLD: "○",
-            }
-            symbol = status_symbols.get(result.status, "?")
-            duration_str = f"{result.duration_ms / 1000:.1f}s"
-            print(f"{symbol} {result.status.value} ({duration_str})")
-            if result.details and result.status == Status.FAILED:
-                # Print first line of error
-                first_line = result.details.split('\n')[0][:60]
-                print(f"    {first_line}...")
+            self.print_result(result)
 
         return results
 
+    async def _run_async(
+        self,
+        models: List[ModelInfo],
+        venv: VenvManager,
+        nnsight_version: str,
+        env_vars: Optional[Dict[str, str]],
+        parallel: int,
+        jobs: int = 1,
+    ) -> List[TestResult]:
+        """Run every (model, scenario) notebook concurrently.
+
+        Notebook execution is a subprocess that mostly waits on NDIF, so each
+        one runs in a worker thread, bounded by a semaphore of size `parallel`.
+        With jobs > 1, notebooks run in a pool of `jobs` worker processes
+        instead. Status updates happen back on the event loop, one at a time,
+        so the per-model status files are never written concurrently.
+        """
+        pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        limit = jobs if pool is not None else parallel
+        sem = asyncio.Semaphore(limit)
+        loop = asyncio.get_running_loop()
+        per_model: List[List[TestResult]] = [[] for _ in models]
+
+        async def run_one(
+            index: int, model: ModelInfo, scenario: Scenario, notebook_path: Optional[Path]
+        ) -> Tuple[int, TestResult]:
+            async with sem:
+                if pool is not None and notebook_path is not None:
+                    # Arguments are passed explicitly so they pickle under spawn
+                    result = await loop.run_in_executor(
+                        pool, run_notebook_test, str(notebook_path), model.model_key,
+                        scenario.name, venv, scenario.timeout, env_vars,
+                    )
+                else:
+                    result = await asyncio.to_thread(
+                        self.run_scenario, model, scenario, venv, env_vars, notebook_path
+                    )
+            self.update_model_status(model.model_key, scenario.name, result, nnsight_version)
+            print(f"  [{model.short_name}] {scenario.name}:", end=" ")
+            self.print_result(result)
+            return index, result
+
+        tasks = []
+        for index, model in enumerate(models):
+            if not model.is_available:
+                # Cold models record results without running anything
+                print(f"\n[{model.short_name}]", end="")
+                per_model[index] = self.run_single_model(model, venv, nnsight_version, env_vars)
+                continue
+
+            notebook_files = {p.stem: p for p in self.ensure_notebooks_generated(model.model_key)}
+            for scenario in self.scenarios:
+                if scenario.model_specific:
+                    if model.architecture.value not in scenario.architectures:
+                        continue
+                tasks.append(run_one(index, model, scenario, notebook_files.get(scenario.name)))
+
+        print(f"\nExecuting {len(tasks)} notebook(s), up to {limit} at a time"
+              f"{' (process pool)' if pool is not None else ''}...")
+        try:
+            # gather() returns in submission order, so scenarios stay in order per model
+            for index, result in await asyncio.gather(*tasks):
+                per_model[index].append(result)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return [r for model_results in per_model for r in model_results]
+
     def run(
         self,
         models: Optional[List[ModelInfo]] = None,
         max_per_architecture: int = 2,
         env_vars: Optional[Dict[str, str]] = None,
         cycle: bool = False,
+        parallel: int = 1,
+        jobs: int = 1,
     ) -> MonitorRun:
         """Run the test matrix.
 
@@ -342,6 +448,8 @@ class MonitorRunner:
             max_per_architecture: Maximum models per architecture
             env_vars: Extra environment variables (e.g., NDIF_API, HF_TOKEN)
             cycle: If True, run only one model (round-robin across runs)
+            parallel: Max notebooks to execute at once (1 = sequential)
+            jobs: Worker processes for notebook execution (1 = use threads)
 
         Returns:
             MonitorRun with all test results
@@ -352,13 +460,15 @@ class MonitorRunner:
         # Fetch available models if not provided
         if models is None:
             print("Fetching NDIF model status...")
-            status = fetch_ndif_status()
-            available = get_available_models(status, hot_only=True)
+            status = fetch_ndif_status(cache_dir=self.status_cache_dir)
+            # Parse once; the summary and the test selection share the list
+            all_models = get_available_models(status, hot_only=False)
+            available = [m for m in all_models if m.deployment_level == DeploymentLevel.HOT]
             print_status_summary(available)
 
             # Get baseline models + extra hot models
             models = get_test_models(
-                status=status,
+                all_models=all_models,
                 include_extra_hot=True,
                 max_extra_per_architecture=max_per_architecture,
             )
@@ -408,15 +518,25 @@ class MonitorRunner:
             print(f"\nRunning {len(models)} model(s) × {len(self.scenarios)} scenarios")
             print("=" * 60)
 
-            for model in models:
-                print(f"\n[{model.short_name}]")
-                model_results = self.run_single_model(
-                    model=model,
+            if parallel > 1 or jobs > 1:
+                results = asyncio.run(self._run_async(
+                    models=models,
                     venv=venv,
                     nnsight_version=nnsight_version,
                     env_vars=notebook_env,
-                )
-                results.extend(model_results)
+                    parallel=parallel,
+                    jobs=jobs,
+                ))
+            else:
+                for model in models:
+                    print(f"\n[{model.short_name}]")
+                    model_results = self.run_single_model(
+                        model=model,
+                        venv=venv,
+                        nnsight_version=nnsight_version,
+                        env_vars=notebook_env,
+                    )
+                    results.extend(model_results)
 
         finally:
             # Always cleanup venv
@@ -453,32 +573,37 @@ class MonitorRunner:
         return run_result
 
     def save_result(self, run: MonitorRun, filename: Optional[str] = None) -> str:
-        """Save run results to JSON file (legacy format).
+        """Append run results to the run log.
+
+        Runs are appended as single lines to run_log.jsonl rather than written
+        to a new file per run. A filename ending in .json writes a standalone
+        file (legacy format).
 
         Args:
             run: MonitorRun to save
-            filename: Custom filename (auto-generates if None)
+            filename: Custom filename (defaults to run_log.jsonl)
 
         Returns:
             Path to saved file
         """
         if filename is None:
-            filename = f"run_{run.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+            filename = RUN_LOG_FILE
 
         output_path = self.results_dir / filename
-        run.save(str(output_path))
+        if output_path.suffix == ".jsonl":
+            run.append_to_log(str(output_path))
+        else:
+            run.save(str(output_path))
         print(f"\nRun log saved to: {output_path}")
         return str(output_path)
 
     def list_model_statuses(self) -> List[ModelStatus]:
-        """List all model status files."""
-        statuses = []
-        for path in self.results_dir.glob("*.json"):
-            if path.name.startswith(".") or path.name.startswith("run_"):
-                continue
-            status = ModelStatus.load(str(path))
-            if status:
-                statuses.append(status)
+        """List all model status files (loaded in parallel)."""
+        paths = list_model_status_paths(self.results_dir)
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(STATUS_LOAD_WORKERS, len(paths))) as executor:
+            statuses = [status for status in executor.map(ModelStatus.load, paths) if status]
         return sorted(statuses, key=lambda s: s.model)
 
     def print_all_statuses(self):
@@ -524,6 +649,8 @@ def run_monitor(
     env_vars: Optional[Dict[str, str]] = None,
     save_results: bool = True,
     cycle: bool = False,
+    parallel: int = 1,
+    jobs: int = 1,
 ) -> MonitorRun:
     """Convenience function to run the monitoring suite.
 
@@ -534,6 +661,8 @@ def run_monitor(
         env_vars: Extra environment variables
         save_results: Whether to save run log (per-model files always saved)
         cycle: Run one model at a time, cycling through
+        parallel: Max notebooks to execute at once (1 = sequential)
+        jobs: Worker processes for notebook execution (1 = use threads)
 
     Returns:
         MonitorRun with all results
@@ -547,6 +676,8 @@ def run_monitor(
         max_per_architecture=max_models,
         env_vars=env_vars,
         cycle=cycle,
+        parallel=parallel,
+        jobs=jobs,
     )
 
     if save_results: